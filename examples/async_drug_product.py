@@ -11,6 +11,18 @@ async def main() -> None:
         products = await client.drug_product(din="00326925")
         for product in products:
             print(product.brand_name, product.drug_identification_number)
+
+        # Looking up many DINs one at a time costs a full round trip each:
+        #
+        #     for din in dins:
+        #         await client.drug_product(din=din)
+        #
+        # `drug_product_many` dispatches them concurrently instead and returns
+        # the flattened results in input order.
+        dins = ["00326925", "02229519", "02245283"]
+        batch = await client.drug_product_many(dins=dins, max_concurrency=8)
+        for product in batch:
+            print(product.brand_name, product.drug_identification_number)
     finally:
         await client.aclose()
 
@@ -0,0 +1,21 @@
+"""Load active ingredients into a polars DataFrame (requires dpd-client[frame])."""
+
+from dpd_client import DPDClient
+
+
+def main() -> None:
+    client = DPDClient()
+    try:
+        # Model-based path: one validated pydantic object per row.
+        models = client.active_ingredient(ingredientname="acetaminophen")
+        print(len(models), "models")
+
+        # Columnar path: response bytes go straight to polars.
+        frame = client.active_ingredient_df(ingredientname="acetaminophen")
+        print(frame.group_by("strength_unit").len())
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
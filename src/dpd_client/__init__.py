@@ -1,19 +1,44 @@
-from .client import DPDClient, AsyncDPDClient
-from .models import (
-    ActiveIngredient,
-    Company,
-    DrugProduct,
-    DosageForm,
-    Packaging,
-    PharmaceuticalStandard,
-    RouteOfAdministration,
-    Schedule,
-    ProductStatus,
-    TherapeuticClass,
-    VeterinarySpecies,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .errors import DPDError, DPDHTTPError, DPDDecodeError, DPDInvalidParam
 
+if TYPE_CHECKING:
+    from .client import DPDClient, AsyncDPDClient
+    from .models import (
+        ActiveIngredient,
+        Company,
+        DrugProduct,
+        DosageForm,
+        Packaging,
+        PharmaceuticalStandard,
+        RouteOfAdministration,
+        Schedule,
+        ProductStatus,
+        TherapeuticClass,
+        VeterinarySpecies,
+    )
+
+# Clients and models pull in httpx and pydantic, so they are imported on first
+# attribute access (PEP 562) to keep `import dpd_client` and the CLI cheap.
+_LAZY_EXPORTS = {
+    "DPDClient": ".client",
+    "AsyncDPDClient": ".client",
+    "ActiveIngredient": ".models",
+    "Company": ".models",
+    "DrugProduct": ".models",
+    "DosageForm": ".models",
+    "Packaging": ".models",
+    "PharmaceuticalStandard": ".models",
+    "RouteOfAdministration": ".models",
+    "Schedule": ".models",
+    "ProductStatus": ".models",
+    "TherapeuticClass": ".models",
+    "VeterinarySpecies": ".models",
+}
+
 __all__ = [
     "DPDClient",
     "AsyncDPDClient",
@@ -33,3 +58,16 @@ __all__ = [
     "DPDDecodeError",
     "DPDInvalidParam",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
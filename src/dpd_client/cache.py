@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from time import monotonic as _now
+from typing import Any, Hashable, Tuple
+
+
+class TTLCache:
+    """Small in-memory LRU cache with a fixed time-to-live per entry.
+
+    Entries expire `ttl` seconds after they are stored but stay available to
+    `peek` until evicted, so they can still be revalidated. Once more than
+    `maxsize` entries are held the least recently used one is evicted; a
+    fresh `get` hit or a `set` counts as a use. Operations are guarded by a
+    lock and never await, so one instance is safe to share between threads
+    and between tasks on an event loop.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        self.ttl = float(ttl)
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for `key`, or None when missing or expired."""
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None or hit[0] < _now():
+                return None
+            self._data.move_to_end(key)
+            return hit[1]
+
+    def peek(self, key: Hashable) -> Any | None:
+        """Return the value for `key` even if it has expired.
+
+        Expired entries are kept until evicted so callers can revalidate them
+        (e.g. with an ETag) instead of refetching from scratch.
+        """
+        with self._lock:
+            hit = self._data.get(key)
+            return None if hit is None else hit[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (_now() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Free-text search params the API matches case-insensitively; queries that
+# differ only in letter case share one cache entry. Whitespace and other
+# characters are kept as sent, since they can change substring matches.
+_FREE_TEXT_PARAMS = frozenset({"brandname", "ingredientname"})
+
+
+def _cache_key(url: str, params: dict[str, Any] | None) -> Tuple[Any, ...]:
+    """Return a hashable key for a request: the URL plus its params, sorted.
+
+    A tuple hashes without formatting or joining any strings; free-text
+    values are only normalised when such a param is present.
+    """
+    if not params:
+        return (url,)
+    if _FREE_TEXT_PARAMS.isdisjoint(params):
+        return (url, *sorted(params.items()))
+    return (url, *sorted([(k, _key_value(k, v)) for k, v in params.items()]))
+
+
+def _key_value(name: str, value: Any) -> Any:
+    if name in _FREE_TEXT_PARAMS and isinstance(value, str):
+        return value.lower()
+    return value
@@ -1,19 +1,62 @@
 from __future__ import annotations
 
-import json
-from typing import Optional
+import atexit
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, TextIO
 
 import typer
-from rich import print_json
 
-from .client import DPDClient
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from .client import DPDClient
 
 
 app = typer.Typer(help="CLI for Health Canada DPD API")
 
 
+# One client per language, shared by every command run in this process so
+# repeated invocations (scripts, CliRunner) reuse the same connection pool.
+_CLIENTS: Dict[str, DPDClient] = {}
+
+
 def _client(lang: str) -> DPDClient:
-    return DPDClient(lang=lang)
+    client = _CLIENTS.get(lang)
+    if client is None:
+        # Imported here so `--help` and argument errors never load httpx/pydantic.
+        from .client import DPDClient
+
+        client = _CLIENTS[lang] = DPDClient(lang=lang)
+    return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    while _CLIENTS:
+        _, client = _CLIENTS.popitem()
+        client.close()
+
+
+def _stream_json(items: Iterable[BaseModel], out: TextIO) -> None:
+    """Write `items` to `out` as a compact JSON array, one model at a time."""
+    out.write("[")
+    for index, item in enumerate(items):
+        if index:
+            out.write(",")
+        out.write(item.model_dump_json())
+    out.write("]\n")
+    out.flush()
+
+
+def _run(method: str, *, lang: str, pretty: bool, **kwargs: Any) -> None:
+    """Call `method` on the shared client and print the results as JSON."""
+    items = getattr(_client(lang), method)(**kwargs)
+    if pretty:
+        from rich import print_json
+
+        print_json(data=[item.model_dump() for item in items])
+    else:
+        _stream_json(items, sys.stdout)
 
 
 @app.command()
@@ -25,16 +68,15 @@ def drugproduct(
     lang: str = typer.Option("en", help="Language: en or fr"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client(lang)
-    try:
-        items = client.drug_product(id=id, din=din, brandname=brandname, status=status, lang=lang)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run(
+        "drug_product",
+        lang=lang,
+        pretty=pretty,
+        id=id,
+        din=din,
+        brandname=brandname,
+        status=status,
+    )
 
 
 @app.command()
@@ -43,16 +85,7 @@ def company(
     lang: str = typer.Option("en", help="Language: en or fr"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client(lang)
-    try:
-        items = client.company(id=id, lang=lang)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run("company", lang=lang, pretty=pretty, id=id)
 
 
 @app.command()
@@ -62,16 +95,7 @@ def activeingredient(
     lang: str = typer.Option("en", help="Language: en or fr"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client(lang)
-    try:
-        items = client.active_ingredient(id=id, ingredientname=ingredientname, lang=lang)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run("active_ingredient", lang=lang, pretty=pretty, id=id, ingredientname=ingredientname)
 
 
 @app.command()
@@ -81,16 +105,7 @@ def form(
     lang: str = typer.Option("en", help="Language: en or fr"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client(lang)
-    try:
-        items = client.form(id=id, active=active, lang=lang)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run("form", lang=lang, pretty=pretty, id=id, active=active)
 
 
 @app.command()
@@ -100,16 +115,7 @@ def route(
     lang: str = typer.Option("en", help="Language: en or fr"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client(lang)
-    try:
-        items = client.route(id=id, active=active, lang=lang)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run("route", lang=lang, pretty=pretty, id=id, active=active)
 
 
 @app.command()
@@ -119,16 +125,7 @@ def schedule(
     lang: str = typer.Option("en", help="Language: en or fr"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client(lang)
-    try:
-        items = client.schedule(id=id, active=active, lang=lang)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run("schedule", lang=lang, pretty=pretty, id=id, active=active)
 
 
 @app.command()
@@ -137,16 +134,7 @@ def status(
     lang: str = typer.Option("en", help="Language: en or fr"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client(lang)
-    try:
-        items = client.status(id=id, lang=lang)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run("status", lang=lang, pretty=pretty, id=id)
 
 
 @app.command()
@@ -154,16 +142,7 @@ def packaging(
     id: int = typer.Option(..., help="Drug product code"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client("en")
-    try:
-        items = client.packaging(id=id)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run("packaging", lang="en", pretty=pretty, id=id)
 
 
 @app.command()
@@ -171,16 +150,7 @@ def pharmaceuticalstd(
     id: int = typer.Option(..., help="Drug product code"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client("en")
-    try:
-        items = client.pharmaceutical_std(id=id)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run("pharmaceutical_std", lang="en", pretty=pretty, id=id)
 
 
 @app.command()
@@ -189,16 +159,7 @@ def therapeuticclass(
     lang: str = typer.Option("en", help="Language: en or fr"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client(lang)
-    try:
-        items = client.therapeutic_class(id=id, lang=lang)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run("therapeutic_class", lang=lang, pretty=pretty, id=id)
 
 
 @app.command()
@@ -207,15 +168,6 @@ def veterinaryspecies(
     lang: str = typer.Option("en", help="Language: en or fr"),
     pretty: bool = typer.Option(True, help="Pretty print JSON output"),
 ):
-    client = _client(lang)
-    try:
-        items = client.veterinary_species(id=id, lang=lang)
-        data = [item.model_dump() for item in items]
-        if pretty:
-            print_json(data=data)
-        else:
-            typer.echo(json.dumps(data))
-    finally:
-        client.close()
+    _run("veterinary_species", lang=lang, pretty=pretty, id=id)
 if __name__ == "__main__":  # pragma: no cover
     app()
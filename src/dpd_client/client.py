@@ -1,8 +1,37 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import asyncio
+import json
+from dataclasses import dataclass
+from functools import partial
+from time import perf_counter_ns
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from .http import HTTPClient, AsyncHTTPClient
+from .cache import TTLCache, _cache_key
+from .codec import ItemParser
+from .errors import DPDDecodeError, DPDInvalidParam
+from .frame import read_frame as _read_frame
+from .structs import decode_structs as _decode_structs
+from .http import HTTPClient, AsyncHTTPClient, decode_json
 from .models import (
     ActiveIngredient,
     Company,
@@ -16,6 +45,7 @@ from .models import (
     TherapeuticClass,
     VeterinarySpecies,
 )
+from .trace import Tracer, _trace_enabled, current_span
 from .params import (
     params_with_id_lang as _params_with_id_lang,
     params_with_id_lang_active as _params_with_id_lang_active,
@@ -25,21 +55,249 @@ from .params import (
     params_activeingredient as _params_activeingredient,
 )
 
+if TYPE_CHECKING:
+    import httpx
+    import polars as pl
+
 
 BASE_URL = "https://health-products.canada.ca/api/drug/"
 
+_M = TypeVar("_M", bound=BaseModel)
+
+
+@dataclass(frozen=True)
+class _EndpointSpec:
+    """How to query one DPD resource and which model its rows validate into.
+
+    `build_params` receives the method's keyword arguments; when `lang` is set
+    it also receives the client's default language as its first argument.
+    `simple_id` marks endpoints queried by `id` alone (plus optional `lang` and
+    `active`), whose common no-override call skips `build_params`.
+    """
+
+    path: str
+    model: Type[BaseModel]
+    build_params: Callable[..., Dict[str, Any]]
+    lang: bool = True
+    simple_id: bool = False
 
-def _normalize_list(data: Any) -> List[Dict[str, Any]]:
+    def params(self, default_lang: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self.simple_id and kwargs["lang"] is None and not kwargs.get("active"):
+            # Same dict `params_with_id_lang` would build, minus the call.
+            return {"type": "json", "lang": default_lang, "id": kwargs["id"]}
+        if self.lang:
+            return self.build_params(default_lang, **kwargs)
+        return self.build_params(**kwargs)
+
+
+_ENDPOINTS: Final[Dict[str, _EndpointSpec]] = {
+    "drug_product": _EndpointSpec("drugproduct/", DrugProduct, _params_drugproduct),
+    "company": _EndpointSpec("company/", Company, _params_with_id_lang, simple_id=True),
+    "active_ingredient": _EndpointSpec(
+        "activeingredient/", ActiveIngredient, _params_activeingredient
+    ),
+    "form": _EndpointSpec("form/", DosageForm, _params_with_id_lang_active, simple_id=True),
+    "packaging": _EndpointSpec("packaging/", Packaging, _params_packaging, lang=False),
+    "pharmaceutical_std": _EndpointSpec(
+        "pharmaceuticalstd/", PharmaceuticalStandard, _params_pharmaceuticalstd, lang=False
+    ),
+    "route": _EndpointSpec(
+        "route/", RouteOfAdministration, _params_with_id_lang_active, simple_id=True
+    ),
+    "schedule": _EndpointSpec("schedule/", Schedule, _params_with_id_lang_active, simple_id=True),
+    "status": _EndpointSpec("status/", ProductStatus, _params_with_id_lang, simple_id=True),
+    "therapeutic_class": _EndpointSpec(
+        "therapeuticclass/", TherapeuticClass, _params_with_id_lang, simple_id=True
+    ),
+    "veterinary_species": _EndpointSpec(
+        "veterinaryspecies/", VeterinarySpecies, _params_with_id_lang, simple_id=True
+    ),
+}
+
+# Endpoints whose `id` is a drug code, so one product's details can be bundled.
+_DRUG_SECTIONS = (
+    "drug_product",
+    "active_ingredient",
+    "form",
+    "packaging",
+    "pharmaceutical_std",
+    "route",
+    "schedule",
+    "status",
+    "therapeutic_class",
+    "veterinary_species",
+)
+
+
+def _normalize_list_safe(data: Any) -> List[Dict[str, Any]]:
+    """Coerce a decoded body to a list of objects, dropping anything else."""
     if data is None:
         return []
-    if isinstance(data, List):
-        return [x for x in data if isinstance(x, Dict)]
-    if isinstance(data, Dict):
+    if isinstance(data, list):
+        if all(type(x) is dict for x in data):
+            # Usual case: hand the decoded list to validation without copying it.
+            return data
+        return [x for x in data if isinstance(x, dict)]
+    if isinstance(data, dict):
         # Some endpoints may return a single object
         return [data]
     return []
 
 
+class _CacheEntry(NamedTuple):
+    """Cached models for one request plus the validators to revalidate them.
+
+    `validated` is False for models built with `model_construct`; those are
+    only served to calls that skip validation too.
+    """
+
+    items: List[Any]
+    etag: str | None
+    last_modified: str | None
+    validated: bool = True
+
+
+_ADAPTERS: Dict[Type[BaseModel], TypeAdapter[List[Any]]] = {}
+
+
+def _adapter(model: Type[BaseModel]) -> TypeAdapter[List[Any]]:
+    """Return a cached `TypeAdapter` validating a list of `model`."""
+    adapter = _ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _ADAPTERS[model] = TypeAdapter(List[model])  # type: ignore[valid-type]
+    return adapter
+
+
+def _build_models(model: Type[BaseModel], content: bytes, validate: bool) -> List[Any]:
+    """Turn a raw response body into `model` instances.
+
+    Validated lists and single objects go to pydantic-core as bytes, so JSON
+    is parsed and validated in one pass without building dicts first. Other
+    shapes (`null` bodies, lists with non-object entries) are decoded and
+    filtered by `_normalize_list_safe` before validation.
+
+    `validate=False` builds models with `model_construct`, which skips all
+    type checks; only use it for responses you trust. Non-object rows are
+    still dropped, as on the validated path.
+    """
+    span = current_span()
+    start = perf_counter_ns() if span is not None else 0
+    if validate:
+        items = _models_from_json(model, content)
+        if items is None:
+            items = _adapter(model).validate_python(_normalize_list_safe(decode_json(content)))
+    else:
+        rows = _normalize_list_safe(decode_json(content))
+        items = [model.model_construct(**row) for row in rows]
+    if span is not None:
+        span.validate_ns += perf_counter_ns() - start
+    return items
+
+
+def _models_from_json(model: Type[BaseModel], content: bytes) -> List[Any] | None:
+    """Validate `content` directly from JSON; None means use the decoded fallback."""
+    head = content[:1]
+    if head.isspace():
+        head = content.lstrip()[:1]
+    try:
+        if head == b"[":
+            return _adapter(model).validate_json(content)
+        if head == b"{":
+            return [model.model_validate_json(content)]
+    except ValidationError:
+        # Re-run on decoded rows: drops non-object entries like before, and
+        # reports malformed JSON as DPDDecodeError and bad rows as-is.
+        return None
+    return None
+
+
+def _row_models(model: Type[BaseModel], rows: List[Any], validate: bool) -> List[Any]:
+    """Build models for streamed rows, skipping non-object entries."""
+    if validate:
+        return [model.model_validate(row) for row in rows if isinstance(row, dict)]
+    return [model.model_construct(**row) for row in rows if isinstance(row, dict)]
+
+
+def _parse_chunk(parser: ItemParser, chunk: bytes | None) -> List[Any]:
+    """Feed `chunk` to `parser` (None finishes the body), mapping decode errors."""
+    try:
+        return parser.feed(chunk) if chunk is not None else parser.close()
+    except json.JSONDecodeError as exc:
+        raise DPDDecodeError("Failed to decode JSON response") from exc
+
+
+async def _gather_bounded(
+    coros: List[Coroutine[Any, Any, List[Any]]], max_concurrency: int
+) -> List[List[Any]]:
+    """Await `coros` concurrently and return their results in input order.
+
+    At most `max_concurrency` awaitables run at once. Every awaitable is
+    allowed to finish before the first failure (if any) is re-raised.
+    """
+    if max_concurrency < 1:
+        for coro in coros:
+            coro.close()
+        raise DPDInvalidParam("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(coro: Coroutine[Any, Any, List[Any]]) -> List[Any]:
+        async with semaphore:
+            return await coro
+
+    results = await asyncio.gather(*(_bounded(c) for c in coros), return_exceptions=True)
+    values: List[List[Any]] = []
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        values.append(result)
+    return values
+
+
+async def _gather_flat(
+    coros: List[Coroutine[Any, Any, List[Any]]], max_concurrency: int
+) -> List[Any]:
+    """Like `_gather_bounded`, flattening the list results in input order."""
+    items: List[Any] = []
+    for result in await _gather_bounded(coros, max_concurrency):
+        items.extend(result)
+    return items
+
+
+async def _first_non_empty(coros: List[Coroutine[Any, Any, List[Any]]]) -> List[Any]:
+    """Race `coros` and return the first non-empty result, cancelling the rest.
+
+    Returns an empty list when every coroutine comes back empty. If none
+    produces a match and at least one failed, the earliest failure is raised.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    pending = set(tasks)
+    failure: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                exc = task.exception()
+                if exc is not None:
+                    failure = failure or exc
+                elif task.result():
+                    return task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    if failure is not None:
+        raise failure
+    return []
+
+
+class _Flight:
+    """An in-flight async request and how many callers are awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[List[Any]]) -> None:
+        self.task = task
+        self.waiters = 0
 
 
 class DPDClient:
@@ -51,8 +309,32 @@ class DPDClient:
     - timeout: request timeout in seconds
     - retries: max retry attempts for transient failures
     - user_agent: custom User-Agent header
+    - cache_ttl: cache validated responses for this many seconds (disabled by default)
+    - cache_maxsize: maximum number of cached responses
+    - http2: use HTTP/2 (default: when `h2` is installed and `DPD_HTTP2` is not "0")
+    - pool_limits: `httpx.Limits` for the connection pool (default: `DEFAULT_POOL_LIMITS`)
+    - trust_responses: skip validation by default (see below)
+
+    Create one client and reuse it: its pool keeps connections alive between
+    calls, so only the first request pays for the TCP/TLS handshake.
+
+    Resource methods accept `validate=False` to build models with
+    `model_construct` instead of validating them; use it only when the
+    response is trusted. `trust_responses=True` makes that the default for
+    every call; `validate=True` still forces validation.
     """
 
+    __slots__ = (
+        "base_url",
+        "default_lang",
+        "trust_responses",
+        "_http",
+        "_cache",
+        "_tracer",
+        "_urls",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         *,
@@ -62,20 +344,89 @@ class DPDClient:
         retries: int = 3,
         user_agent: str | None = None,
         cache_ttl: float | int | None = None,
+        cache_maxsize: int = 256,
+        http2: bool | None = None,
+        pool_limits: httpx.Limits | None = None,
+        trust_responses: bool = False,
     ) -> None:
         self.base_url = base_url.rstrip("/") + "/"
         self.default_lang = lang
+        self.trust_responses = trust_responses
         self._http = HTTPClient(
             self.base_url,
             timeout=timeout,
             max_retries=retries,
             user_agent=user_agent,
-            cache_ttl=cache_ttl,
+            http2=http2,
+            limits=pool_limits,
         )
+        self._cache = TTLCache(cache_ttl, cache_maxsize) if cache_ttl else None
+        self._tracer = Tracer() if _trace_enabled() else None
+        self._urls = {name: self._http.resolve(spec.path) for name, spec in _ENDPOINTS.items()}
 
     def close(self) -> None:
         self._http.close()
 
+    def cache_clear(self) -> None:
+        """Drop every cached response."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    @staticmethod
+    def construct(model: Type[_M], data: Dict[str, Any]) -> _M:
+        """Build `model` from already-trusted `data` without validating it.
+
+        Meant for re-materialising models from data this client returned
+        (e.g. filtered `model_dump()` output); no coercion or checks are run.
+        """
+        return model.model_construct(**data)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-endpoint call timings; empty when `DPD_TRACE=0`.
+
+        Each entry has `count`, total-latency `p50_ns`/`p99_ns`, the median
+        `http_p50_ns`, `parse_p50_ns` and `validate_p50_ns` phases, and
+        `bytes_in` over the most recent calls.
+        """
+        return self._tracer.metrics() if self._tracer is not None else {}
+
+    def _fetch(self, name: str, *, validate: bool | None, **kwargs: Any) -> List[Any]:
+        if validate is None:
+            validate = not self.trust_responses
+        if self._tracer is None:
+            return self._load(name, validate, kwargs)
+        with self._tracer.span(name):
+            return self._load(name, validate, kwargs)
+
+    def _load(self, name: str, validate: bool, kwargs: Dict[str, Any]) -> List[Any]:
+        spec = _ENDPOINTS[name]
+        params = spec.params(self.default_lang, kwargs)
+        cache = self._cache
+        key = _cache_key(spec.path, params)
+        stale: _CacheEntry | None = None
+        if cache is not None:
+            hit = cache.get(key)
+            if hit is not None and (hit.validated or not validate):
+                return list(hit.items)
+            stale = cache.peek(key)
+            if stale is not None and validate and not stale.validated:
+                # A 304 would hand back unchecked models; fetch afresh instead.
+                stale = None
+        resp = self._http.fetch_json(
+            self._urls[name],
+            params,
+            etag=stale.etag if stale else None,
+            last_modified=stale.last_modified if stale else None,
+            decode=False,
+        )
+        if resp.not_modified and cache is not None and stale is not None:
+            cache.set(key, stale)
+            return list(stale.items)
+        items = _build_models(spec.model, resp.content, validate)
+        if cache is not None:
+            cache.set(key, _CacheEntry(items, resp.etag, resp.last_modified, validate))
+        return list(items)
+
     # ---------- Resource methods ----------
     def drug_product(
         self,
@@ -85,23 +436,28 @@ class DPDClient:
         brandname: str | None = None,
         status: str | None = None,
         lang: str | None = None,
+        validate: bool | None = None,
     ) -> List[DrugProduct]:
         """Return drug products filtered by DIN, ID, brand name, or status.
 
         The response from the `drugproduct/` endpoint is normalized to a
         list of `DrugProduct` models even when the API returns a single object.
         """
-        params = _params_drugproduct(
-            self.default_lang, id=id, din=din, brandname=brandname, status=status, lang=lang
+        return self._fetch(
+            "drug_product",
+            validate=validate,
+            id=id,
+            din=din,
+            brandname=brandname,
+            status=status,
+            lang=lang,
         )
-        data = self._http.get_json("drugproduct/", params)
-        return [DrugProduct.model_validate(obj) for obj in _normalize_list(data)]
 
-    def company(self, *, id: int, lang: str | None = None) -> List[Company]:
+    def company(
+        self, *, id: int, lang: str | None = None, validate: bool | None = None
+    ) -> List[Company]:
         """Return company metadata for the supplied company code."""
-        params = _params_with_id_lang(self.default_lang, id=id, lang=lang)
-        data = self._http.get_json("company/", params)
-        return [Company.model_validate(obj) for obj in _normalize_list(data)]
+        return self._fetch("company", validate=validate, id=id, lang=lang)
 
     def active_ingredient(
         self,
@@ -109,72 +465,224 @@ class DPDClient:
         id: int | None = None,
         ingredientname: str | None = None,
         lang: str | None = None,
+        validate: bool | None = None,
     ) -> List[ActiveIngredient]:
         """Return active ingredients filtered by code or name."""
-        params = _params_activeingredient(
-            self.default_lang, id=id, ingredientname=ingredientname, lang=lang
+        return self._fetch(
+            "active_ingredient", validate=validate, id=id, ingredientname=ingredientname, lang=lang
         )
-        data = self._http.get_json("activeingredient/", params)
-        return [ActiveIngredient.model_validate(obj) for obj in _normalize_list(data)]
 
-    def form(self, *, id: int, active: bool | None = None, lang: str | None = None) -> List[DosageForm]:
+    def form(
+        self,
+        *,
+        id: int,
+        active: bool | None = None,
+        lang: str | None = None,
+        validate: bool | None = None,
+    ) -> List[DosageForm]:
         """Return dosage form records for a drug product.
 
         Pass `active=True` to ask the API for active forms only.
         """
-        params = _params_with_id_lang_active(self.default_lang, id=id, active=active, lang=lang)
-        data = self._http.get_json("form/", params)
-        return [DosageForm.model_validate(obj) for obj in _normalize_list(data)]
+        return self._fetch("form", validate=validate, id=id, active=active, lang=lang)
 
-    def packaging(self, *, id: int) -> List[Packaging]:
+    def packaging(self, *, id: int, validate: bool | None = None) -> List[Packaging]:
         """Return packaging details for a drug product."""
-        params = _params_packaging(id)
-        data = self._http.get_json("packaging/", params)
-        return [Packaging.model_validate(obj) for obj in _normalize_list(data)]
+        return self._fetch("packaging", validate=validate, id=id)
 
-    def pharmaceutical_std(self, *, id: int) -> List[PharmaceuticalStandard]:
+    def pharmaceutical_std(
+        self, *, id: int, validate: bool | None = None
+    ) -> List[PharmaceuticalStandard]:
         """Return pharmaceutical standards for a drug product."""
-        params = _params_pharmaceuticalstd(id)
-        data = self._http.get_json("pharmaceuticalstd/", params)
-        return [PharmaceuticalStandard.model_validate(obj) for obj in _normalize_list(data)]
+        return self._fetch("pharmaceutical_std", validate=validate, id=id)
 
     def route(
-        self, *, id: int, active: bool | None = None, lang: str | None = None
+        self,
+        *,
+        id: int,
+        active: bool | None = None,
+        lang: str | None = None,
+        validate: bool | None = None,
     ) -> List[RouteOfAdministration]:
         """Return routes of administration for a drug product."""
-        params = _params_with_id_lang_active(self.default_lang, id=id, active=active, lang=lang)
-        data = self._http.get_json("route/", params)
-        return [RouteOfAdministration.model_validate(obj) for obj in _normalize_list(data)]
+        return self._fetch("route", validate=validate, id=id, active=active, lang=lang)
 
     def schedule(
-        self, *, id: int, active: bool | None = None, lang: str | None = None
+        self,
+        *,
+        id: int,
+        active: bool | None = None,
+        lang: str | None = None,
+        validate: bool | None = None,
     ) -> List[Schedule]:
         """Return scheduling details for a drug product."""
-        params = _params_with_id_lang_active(self.default_lang, id=id, active=active, lang=lang)
-        data = self._http.get_json("schedule/", params)
-        return [Schedule.model_validate(obj) for obj in _normalize_list(data)]
+        return self._fetch("schedule", validate=validate, id=id, active=active, lang=lang)
 
-    def status(self, *, id: int, lang: str | None = None) -> List[ProductStatus]:
+    def status(
+        self, *, id: int, lang: str | None = None, validate: bool | None = None
+    ) -> List[ProductStatus]:
         """Return product status history for a drug product."""
-        params = _params_with_id_lang(self.default_lang, id=id, lang=lang)
-        data = self._http.get_json("status/", params)
-        return [ProductStatus.model_validate(obj) for obj in _normalize_list(data)]
+        return self._fetch("status", validate=validate, id=id, lang=lang)
 
     def therapeutic_class(
-        self, *, id: int, lang: str | None = None
+        self, *, id: int, lang: str | None = None, validate: bool | None = None
     ) -> List[TherapeuticClass]:
         """Return therapeutic classification records for a drug product."""
-        params = _params_with_id_lang(self.default_lang, id=id, lang=lang)
-        data = self._http.get_json("therapeuticclass/", params)
-        return [TherapeuticClass.model_validate(obj) for obj in _normalize_list(data)]
+        return self._fetch("therapeutic_class", validate=validate, id=id, lang=lang)
 
     def veterinary_species(
-        self, *, id: int, lang: str | None = None
+        self, *, id: int, lang: str | None = None, validate: bool | None = None
     ) -> List[VeterinarySpecies]:
         """Return veterinary species associated with a drug product."""
-        params = _params_with_id_lang(self.default_lang, id=id, lang=lang)
-        data = self._http.get_json("veterinaryspecies/", params)
-        return [VeterinarySpecies.model_validate(obj) for obj in _normalize_list(data)]
+        return self._fetch("veterinary_species", validate=validate, id=id, lang=lang)
+
+    # ---------- DataFrame output ----------
+    def drug_product_df(
+        self,
+        *,
+        id: int | None = None,
+        din: str | None = None,
+        brandname: str | None = None,
+        status: str | None = None,
+        lang: str | None = None,
+    ) -> pl.DataFrame:
+        """Return `drug_product` results as a polars DataFrame.
+
+        The response bytes are parsed by polars directly, so no models are
+        built and the cache is bypassed. Requires the `frame` extra.
+        """
+        return self._fetch_frame(
+            "drug_product", id=id, din=din, brandname=brandname, status=status, lang=lang
+        )
+
+    def active_ingredient_df(
+        self, *, id: int | None = None, ingredientname: str | None = None, lang: str | None = None
+    ) -> pl.DataFrame:
+        """Return `active_ingredient` results as a polars DataFrame."""
+        return self._fetch_frame(
+            "active_ingredient", id=id, ingredientname=ingredientname, lang=lang
+        )
+
+    def _fetch_frame(self, name: str, **kwargs: Any) -> pl.DataFrame:
+        spec = _ENDPOINTS[name]
+        params = spec.params(self.default_lang, kwargs)
+        return _read_frame(self._http.get_bytes(self._urls[name], params))
+
+    # ---------- Raw output ----------
+    def drug_product_raw(
+        self,
+        *,
+        id: int | None = None,
+        din: str | None = None,
+        brandname: str | None = None,
+        status: str | None = None,
+        lang: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Return `drug_product` results as decoded JSON objects.
+
+        No models are built and nothing is validated: each dict is a row as
+        the DPD API sent it, for callers that only pass results on as JSON.
+        Single-object and empty bodies are normalised to lists like the model
+        methods, and the cache is bypassed.
+        """
+        return self._fetch_raw(
+            "drug_product", id=id, din=din, brandname=brandname, status=status, lang=lang
+        )
+
+    def active_ingredient_raw(
+        self, *, id: int | None = None, ingredientname: str | None = None, lang: str | None = None
+    ) -> List[Dict[str, Any]]:
+        """Return `active_ingredient` results as decoded JSON objects."""
+        return self._fetch_raw(
+            "active_ingredient", id=id, ingredientname=ingredientname, lang=lang
+        )
+
+    def _fetch_raw(self, name: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        spec = _ENDPOINTS[name]
+        params = spec.params(self.default_lang, kwargs)
+        return _normalize_list_safe(self._http.get_json(self._urls[name], params))
+
+    # ---------- msgspec output ----------
+    def drug_product_structs(
+        self,
+        *,
+        id: int | None = None,
+        din: str | None = None,
+        brandname: str | None = None,
+        status: str | None = None,
+        lang: str | None = None,
+    ) -> List[Any]:
+        """Return `drug_product` results as `msgspec.Struct` instances.
+
+        msgspec decodes and type-checks the response bytes in one pass, which
+        is several times faster than validating pydantic models. The structs
+        mirror `DrugProduct`'s fields (see `dpd_client.structs.struct_type`)
+        but drop undeclared ones. The cache is bypassed. Requires the
+        `structs` extra.
+        """
+        return self._fetch_structs(
+            "drug_product", id=id, din=din, brandname=brandname, status=status, lang=lang
+        )
+
+    def active_ingredient_structs(
+        self, *, id: int | None = None, ingredientname: str | None = None, lang: str | None = None
+    ) -> List[Any]:
+        """Return `active_ingredient` results as `msgspec.Struct` instances."""
+        return self._fetch_structs(
+            "active_ingredient", id=id, ingredientname=ingredientname, lang=lang
+        )
+
+    def _fetch_structs(self, name: str, **kwargs: Any) -> List[Any]:
+        spec = _ENDPOINTS[name]
+        params = spec.params(self.default_lang, kwargs)
+        return _decode_structs(spec.model, self._http.get_bytes(self._urls[name], params))
+
+    # ---------- Streaming ----------
+    def iter_drug_product(
+        self,
+        *,
+        id: int | None = None,
+        din: str | None = None,
+        brandname: str | None = None,
+        status: str | None = None,
+        lang: str | None = None,
+        validate: bool | None = None,
+    ) -> Iterator[DrugProduct]:
+        """Yield `drug_product` results one model at a time as the body downloads.
+
+        Peak memory stays near one network chunk plus the rows parsed from it,
+        instead of the whole body and every model at once, which suits broad
+        `status` or `brandname` queries. Incremental parsing needs the
+        `stream` extra (`ijson`); without it the body is buffered and decoded
+        once, but models are still built lazily. The cache is bypassed. Close
+        the iterator (or exhaust it) to release the connection.
+        """
+        return self._iter_models(
+            "drug_product",
+            validate=validate,
+            id=id,
+            din=din,
+            brandname=brandname,
+            status=status,
+            lang=lang,
+        )
+
+    def _iter_models(self, name: str, *, validate: bool | None, **kwargs: Any) -> Iterator[Any]:
+        # Build params eagerly so invalid arguments raise at call time.
+        spec = _ENDPOINTS[name]
+        params = spec.params(self.default_lang, kwargs)
+        if validate is None:
+            validate = not self.trust_responses
+        return self._stream_models(spec.model, self._urls[name], params, validate)
+
+    def _stream_models(
+        self, model: Type[BaseModel], url: httpx.URL, params: Dict[str, Any], validate: bool
+    ) -> Iterator[Any]:
+        parser = ItemParser()
+        with self._http.stream(url, params) as chunks:
+            for chunk in chunks:
+                yield from _row_models(model, _parse_chunk(parser, chunk), validate)
+        yield from _row_models(model, _parse_chunk(parser, None), validate)
 
     # Backwards-compatible aliases (pre-0.2 method names).
     drugproduct = drug_product
@@ -185,7 +693,23 @@ class DPDClient:
 
 
 class AsyncDPDClient:
-    """Async client for Health Canada DPD API (httpx.AsyncClient based)."""
+    """Async client for Health Canada DPD API (httpx.AsyncClient based).
+
+    Takes the same parameters as `DPDClient`. With HTTP/2, concurrent calls
+    are multiplexed over shared connections.
+    """
+
+    __slots__ = (
+        "base_url",
+        "default_lang",
+        "trust_responses",
+        "_http",
+        "_cache",
+        "_tracer",
+        "_urls",
+        "_inflight",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -196,20 +720,121 @@ class AsyncDPDClient:
         retries: int = 3,
         user_agent: str | None = None,
         cache_ttl: float | int | None = None,
+        cache_maxsize: int = 256,
+        http2: bool | None = None,
+        pool_limits: httpx.Limits | None = None,
+        trust_responses: bool = False,
     ) -> None:
         self.base_url = base_url.rstrip("/") + "/"
         self.default_lang = lang
+        self.trust_responses = trust_responses
         self._http = AsyncHTTPClient(
             self.base_url,
             timeout=timeout,
             max_retries=retries,
             user_agent=user_agent,
-            cache_ttl=cache_ttl,
+            http2=http2,
+            limits=pool_limits,
         )
+        self._cache = TTLCache(cache_ttl, cache_maxsize) if cache_ttl else None
+        self._tracer = Tracer() if _trace_enabled() else None
+        self._urls = {name: self._http.resolve(spec.path) for name, spec in _ENDPOINTS.items()}
+        self._inflight: Dict[Tuple[Tuple[Any, ...], bool], _Flight] = {}
 
     async def aclose(self) -> None:
         await self._http.aclose()
 
+    def stats(self) -> Dict[str, Any]:
+        """Return request activity counters (`http2`, `in_flight`, `requests`)."""
+        return self._http.stats()
+
+    def cache_clear(self) -> None:
+        """Drop every cached response."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    @staticmethod
+    def construct(model: Type[_M], data: Dict[str, Any]) -> _M:
+        """Same as `DPDClient.construct`."""
+        return model.model_construct(**data)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-endpoint call timings; see `DPDClient.metrics`."""
+        return self._tracer.metrics() if self._tracer is not None else {}
+
+    async def _fetch(self, name: str, *, validate: bool | None, **kwargs: Any) -> List[Any]:
+        if validate is None:
+            validate = not self.trust_responses
+        if self._tracer is None:
+            return await self._load(name, validate, kwargs)
+        with self._tracer.span(name):
+            return await self._load(name, validate, kwargs)
+
+    async def _load(self, name: str, validate: bool, kwargs: Dict[str, Any]) -> List[Any]:
+        spec = _ENDPOINTS[name]
+        params = spec.params(self.default_lang, kwargs)
+        cache = self._cache
+        key = _cache_key(spec.path, params)
+        if cache is not None:
+            hit = cache.get(key)
+            if hit is not None and (hit.validated or not validate):
+                return list(hit.items)
+        # Identical calls already waiting on the network share that request.
+        flight_key = (key, validate)
+        flight = self._inflight.get(flight_key)
+        if flight is None:
+            task = asyncio.ensure_future(self._fetch_models(name, params, key, validate))
+            flight = self._inflight[flight_key] = _Flight(task)
+            task.add_done_callback(partial(self._landed, flight_key))
+        flight.waiters += 1
+        try:
+            # Shielded so one caller giving up does not cancel it for the others.
+            return list(await asyncio.shield(flight.task))
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # The last caller was cancelled: free the connection too. Drop
+                # the entry first so a new identical call starts a fresh fetch
+                # instead of joining the task being cancelled.
+                if self._inflight.get(flight_key) is flight:
+                    del self._inflight[flight_key]
+                flight.task.cancel()
+
+    def _landed(
+        self, flight_key: Tuple[Tuple[Any, ...], bool], task: asyncio.Future[List[Any]]
+    ) -> None:
+        flight = self._inflight.get(flight_key)
+        if flight is not None and flight.task is task:
+            del self._inflight[flight_key]
+        if not task.cancelled():
+            # Mark the error as retrieved; every waiter re-raises it itself.
+            task.exception()
+
+    async def _fetch_models(
+        self, name: str, params: Dict[str, Any], key: Tuple[Any, ...], validate: bool
+    ) -> List[Any]:
+        cache = self._cache
+        stale: _CacheEntry | None = None
+        if cache is not None:
+            stale = cache.peek(key)
+            if stale is not None and validate and not stale.validated:
+                # A 304 would hand back unchecked models; fetch afresh instead.
+                stale = None
+        resp = await self._http.fetch_json(
+            self._urls[name],
+            params,
+            etag=stale.etag if stale else None,
+            last_modified=stale.last_modified if stale else None,
+            decode=False,
+        )
+        if resp.not_modified and cache is not None and stale is not None:
+            cache.set(key, stale)
+            return stale.items
+        items = _build_models(_ENDPOINTS[name].model, resp.content, validate)
+        if cache is not None:
+            cache.set(key, _CacheEntry(items, resp.etag, resp.last_modified, validate))
+        return items
+
     async def drug_product(
         self,
         *,
@@ -218,19 +843,24 @@ class AsyncDPDClient:
         brandname: str | None = None,
         status: str | None = None,
         lang: str | None = None,
+        validate: bool | None = None,
     ) -> List[DrugProduct]:
         """Async variant of `DPDClient.drug_product`."""
-        params = _params_drugproduct(
-            self.default_lang, id=id, din=din, brandname=brandname, status=status, lang=lang
+        return await self._fetch(
+            "drug_product",
+            validate=validate,
+            id=id,
+            din=din,
+            brandname=brandname,
+            status=status,
+            lang=lang,
         )
-        data = await self._http.get_json("drugproduct/", params)
-        return [DrugProduct.model_validate(obj) for obj in _normalize_list(data)]
 
-    async def company(self, *, id: int, lang: str | None = None) -> List[Company]:
+    async def company(
+        self, *, id: int, lang: str | None = None, validate: bool | None = None
+    ) -> List[Company]:
         """Async variant of `DPDClient.company`."""
-        params = _params_with_id_lang(self.default_lang, id=id, lang=lang)
-        data = await self._http.get_json("company/", params)
-        return [Company.model_validate(obj) for obj in _normalize_list(data)]
+        return await self._fetch("company", validate=validate, id=id, lang=lang)
 
     async def active_ingredient(
         self,
@@ -238,71 +868,338 @@ class AsyncDPDClient:
         id: int | None = None,
         ingredientname: str | None = None,
         lang: str | None = None,
+        validate: bool | None = None,
     ) -> List[ActiveIngredient]:
         """Async variant of `DPDClient.active_ingredient`."""
-        params = _params_activeingredient(
-            self.default_lang, id=id, ingredientname=ingredientname, lang=lang
+        return await self._fetch(
+            "active_ingredient", validate=validate, id=id, ingredientname=ingredientname, lang=lang
         )
-        data = await self._http.get_json("activeingredient/", params)
-        return [ActiveIngredient.model_validate(obj) for obj in _normalize_list(data)]
 
     async def form(
-        self, *, id: int, active: bool | None = None, lang: str | None = None
+        self,
+        *,
+        id: int,
+        active: bool | None = None,
+        lang: str | None = None,
+        validate: bool | None = None,
     ) -> List[DosageForm]:
         """Async variant of `DPDClient.form`."""
-        params = _params_with_id_lang_active(self.default_lang, id=id, active=active, lang=lang)
-        data = await self._http.get_json("form/", params)
-        return [DosageForm.model_validate(obj) for obj in _normalize_list(data)]
+        return await self._fetch("form", validate=validate, id=id, active=active, lang=lang)
 
-    async def packaging(self, *, id: int) -> List[Packaging]:
+    async def packaging(self, *, id: int, validate: bool | None = None) -> List[Packaging]:
         """Async variant of `DPDClient.packaging`."""
-        params = _params_packaging(id)
-        data = await self._http.get_json("packaging/", params)
-        return [Packaging.model_validate(obj) for obj in _normalize_list(data)]
+        return await self._fetch("packaging", validate=validate, id=id)
 
-    async def pharmaceutical_std(self, *, id: int) -> List[PharmaceuticalStandard]:
+    async def pharmaceutical_std(
+        self, *, id: int, validate: bool | None = None
+    ) -> List[PharmaceuticalStandard]:
         """Async variant of `DPDClient.pharmaceutical_std`."""
-        params = _params_pharmaceuticalstd(id)
-        data = await self._http.get_json("pharmaceuticalstd/", params)
-        return [PharmaceuticalStandard.model_validate(obj) for obj in _normalize_list(data)]
+        return await self._fetch("pharmaceutical_std", validate=validate, id=id)
 
     async def route(
-        self, *, id: int, active: bool | None = None, lang: str | None = None
+        self,
+        *,
+        id: int,
+        active: bool | None = None,
+        lang: str | None = None,
+        validate: bool | None = None,
     ) -> List[RouteOfAdministration]:
         """Async variant of `DPDClient.route`."""
-        params = _params_with_id_lang_active(self.default_lang, id=id, active=active, lang=lang)
-        data = await self._http.get_json("route/", params)
-        return [RouteOfAdministration.model_validate(obj) for obj in _normalize_list(data)]
+        return await self._fetch("route", validate=validate, id=id, active=active, lang=lang)
 
     async def schedule(
-        self, *, id: int, active: bool | None = None, lang: str | None = None
+        self,
+        *,
+        id: int,
+        active: bool | None = None,
+        lang: str | None = None,
+        validate: bool | None = None,
     ) -> List[Schedule]:
         """Async variant of `DPDClient.schedule`."""
-        params = _params_with_id_lang_active(self.default_lang, id=id, active=active, lang=lang)
-        data = await self._http.get_json("schedule/", params)
-        return [Schedule.model_validate(obj) for obj in _normalize_list(data)]
+        return await self._fetch("schedule", validate=validate, id=id, active=active, lang=lang)
 
-    async def status(self, *, id: int, lang: str | None = None) -> List[ProductStatus]:
+    async def status(
+        self, *, id: int, lang: str | None = None, validate: bool | None = None
+    ) -> List[ProductStatus]:
         """Async variant of `DPDClient.status`."""
-        params = _params_with_id_lang(self.default_lang, id=id, lang=lang)
-        data = await self._http.get_json("status/", params)
-        return [ProductStatus.model_validate(obj) for obj in _normalize_list(data)]
+        return await self._fetch("status", validate=validate, id=id, lang=lang)
 
     async def therapeutic_class(
-        self, *, id: int, lang: str | None = None
+        self, *, id: int, lang: str | None = None, validate: bool | None = None
     ) -> List[TherapeuticClass]:
         """Async variant of `DPDClient.therapeutic_class`."""
-        params = _params_with_id_lang(self.default_lang, id=id, lang=lang)
-        data = await self._http.get_json("therapeuticclass/", params)
-        return [TherapeuticClass.model_validate(obj) for obj in _normalize_list(data)]
+        return await self._fetch("therapeutic_class", validate=validate, id=id, lang=lang)
 
     async def veterinary_species(
-        self, *, id: int, lang: str | None = None
+        self, *, id: int, lang: str | None = None, validate: bool | None = None
     ) -> List[VeterinarySpecies]:
         """Async variant of `DPDClient.veterinary_species`."""
-        params = _params_with_id_lang(self.default_lang, id=id, lang=lang)
-        data = await self._http.get_json("veterinaryspecies/", params)
-        return [VeterinarySpecies.model_validate(obj) for obj in _normalize_list(data)]
+        return await self._fetch("veterinary_species", validate=validate, id=id, lang=lang)
+
+    # ---------- Batch helpers ----------
+    async def drug_product_many(
+        self, *, dins: Iterable[str], lang: str | None = None, max_concurrency: int = 16
+    ) -> List[DrugProduct]:
+        """Return drug products for many DINs, fetched concurrently.
+
+        Results are flattened in input order. At most `max_concurrency`
+        requests are in flight at once.
+        """
+        coros = [self.drug_product(din=din, lang=lang) for din in dins]
+        return await _gather_flat(coros, max_concurrency)
+
+    async def company_many(
+        self, *, ids: Iterable[int], lang: str | None = None, max_concurrency: int = 16
+    ) -> List[Company]:
+        """Concurrent variant of `company` for many company codes."""
+        coros = [self.company(id=id, lang=lang) for id in ids]
+        return await _gather_flat(coros, max_concurrency)
+
+    async def active_ingredient_many(
+        self, *, ids: Iterable[int], lang: str | None = None, max_concurrency: int = 16
+    ) -> List[ActiveIngredient]:
+        """Concurrent variant of `active_ingredient` for many drug codes."""
+        coros = [self.active_ingredient(id=id, lang=lang) for id in ids]
+        return await _gather_flat(coros, max_concurrency)
+
+    async def bundle(
+        self,
+        id: int,
+        *,
+        sections: Iterable[str] = _DRUG_SECTIONS,
+        lang: str | None = None,
+        max_concurrency: int = 8,
+    ) -> Dict[str, List[Any]]:
+        """Fetch several per-drug resources for drug code `id` concurrently.
+
+        `sections` are resource method names (`"form"`, `"route"`, ...;
+        all drug-code endpoints by default). Returns a dict mapping each
+        section to its results. At most `max_concurrency` requests are in
+        flight at once.
+        """
+        names = list(dict.fromkeys(sections))
+        unknown = [name for name in names if name not in _DRUG_SECTIONS]
+        if unknown:
+            raise DPDInvalidParam(
+                f"Unknown bundle section(s) {', '.join(unknown)}; "
+                f"choose from {', '.join(_DRUG_SECTIONS)}"
+            )
+        coros = []
+        for name in names:
+            kwargs: Dict[str, Any] = {"id": id}
+            if _ENDPOINTS[name].lang:
+                kwargs["lang"] = lang
+            coros.append(getattr(self, name)(**kwargs))
+        results = await _gather_bounded(coros, max_concurrency)
+        return dict(zip(names, results))
+
+    async def drug_product_first(
+        self,
+        *,
+        dins: Iterable[str] = (),
+        brandnames: Iterable[str] = (),
+        lang: str | None = None,
+    ) -> List[DrugProduct]:
+        """Return the first non-empty `drug_product` result among several lookups.
+
+        One request per DIN and brand name is started at once; as soon as any
+        of them matches, the others are cancelled so their connections go back
+        to the pool. Returns an empty list if nothing matches.
+        """
+        coros = [self.drug_product(din=din, lang=lang) for din in dins]
+        coros += [self.drug_product(brandname=name, lang=lang) for name in brandnames]
+        return await _first_non_empty(coros)
+
+    async def stream_drug_product(
+        self,
+        dins: Union[Iterable[str], AsyncIterable[str]],
+        *,
+        lang: str | None = None,
+        workers: int = 8,
+    ) -> AsyncIterator[Tuple[str, List[DrugProduct]]]:
+        """Yield `(din, products)` pairs as lookups complete.
+
+        DINs are pulled lazily from `dins` (sync or async iterable) and looked
+        up by `workers` concurrent tasks. The input queue holds at most
+        `2 * workers` DINs, so a slow consumer applies backpressure to the
+        source. Pairs arrive in completion order; the first failure is raised
+        from the iterator and cancels the remaining work.
+        """
+        if workers < 1:
+            raise DPDInvalidParam("workers must be at least 1")
+        done = object()
+        in_q: asyncio.Queue[Any] = asyncio.Queue(maxsize=2 * workers)
+        out_q: asyncio.Queue[Any] = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                if isinstance(dins, AsyncIterable):
+                    async for din in dins:
+                        await in_q.put(din)
+                else:
+                    for din in dins:
+                        await in_q.put(din)
+            except Exception as exc:
+                await out_q.put(exc)
+                return
+            for _ in range(workers):
+                await in_q.put(done)
+
+        async def work() -> None:
+            while True:
+                din = await in_q.get()
+                if din is done:
+                    await out_q.put(done)
+                    return
+                try:
+                    products = await self.drug_product(din=din, lang=lang)
+                except Exception as exc:
+                    await out_q.put(exc)
+                    return
+                await out_q.put((din, products))
+
+        tasks = [asyncio.ensure_future(produce())]
+        tasks.extend(asyncio.ensure_future(work()) for _ in range(workers))
+        try:
+            running = workers
+            while running:
+                item = await out_q.get()
+                if item is done:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ---------- DataFrame output ----------
+    async def drug_product_df(
+        self,
+        *,
+        id: int | None = None,
+        din: str | None = None,
+        brandname: str | None = None,
+        status: str | None = None,
+        lang: str | None = None,
+    ) -> pl.DataFrame:
+        """Async variant of `DPDClient.drug_product_df`."""
+        return await self._fetch_frame(
+            "drug_product", id=id, din=din, brandname=brandname, status=status, lang=lang
+        )
+
+    async def active_ingredient_df(
+        self, *, id: int | None = None, ingredientname: str | None = None, lang: str | None = None
+    ) -> pl.DataFrame:
+        """Async variant of `DPDClient.active_ingredient_df`."""
+        return await self._fetch_frame(
+            "active_ingredient", id=id, ingredientname=ingredientname, lang=lang
+        )
+
+    async def _fetch_frame(self, name: str, **kwargs: Any) -> pl.DataFrame:
+        spec = _ENDPOINTS[name]
+        params = spec.params(self.default_lang, kwargs)
+        return _read_frame(await self._http.get_bytes(self._urls[name], params))
+
+    # ---------- Raw output ----------
+    async def drug_product_raw(
+        self,
+        *,
+        id: int | None = None,
+        din: str | None = None,
+        brandname: str | None = None,
+        status: str | None = None,
+        lang: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Async variant of `DPDClient.drug_product_raw`."""
+        return await self._fetch_raw(
+            "drug_product", id=id, din=din, brandname=brandname, status=status, lang=lang
+        )
+
+    async def active_ingredient_raw(
+        self, *, id: int | None = None, ingredientname: str | None = None, lang: str | None = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of `DPDClient.active_ingredient_raw`."""
+        return await self._fetch_raw(
+            "active_ingredient", id=id, ingredientname=ingredientname, lang=lang
+        )
+
+    async def _fetch_raw(self, name: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        spec = _ENDPOINTS[name]
+        params = spec.params(self.default_lang, kwargs)
+        return _normalize_list_safe(await self._http.get_json(self._urls[name], params))
+
+    # ---------- msgspec output ----------
+    async def drug_product_structs(
+        self,
+        *,
+        id: int | None = None,
+        din: str | None = None,
+        brandname: str | None = None,
+        status: str | None = None,
+        lang: str | None = None,
+    ) -> List[Any]:
+        """Async variant of `DPDClient.drug_product_structs`."""
+        return await self._fetch_structs(
+            "drug_product", id=id, din=din, brandname=brandname, status=status, lang=lang
+        )
+
+    async def active_ingredient_structs(
+        self, *, id: int | None = None, ingredientname: str | None = None, lang: str | None = None
+    ) -> List[Any]:
+        """Async variant of `DPDClient.active_ingredient_structs`."""
+        return await self._fetch_structs(
+            "active_ingredient", id=id, ingredientname=ingredientname, lang=lang
+        )
+
+    async def _fetch_structs(self, name: str, **kwargs: Any) -> List[Any]:
+        spec = _ENDPOINTS[name]
+        params = spec.params(self.default_lang, kwargs)
+        return _decode_structs(spec.model, await self._http.get_bytes(self._urls[name], params))
+
+    # ---------- Streaming ----------
+    def iter_drug_product(
+        self,
+        *,
+        id: int | None = None,
+        din: str | None = None,
+        brandname: str | None = None,
+        status: str | None = None,
+        lang: str | None = None,
+        validate: bool | None = None,
+    ) -> AsyncIterator[DrugProduct]:
+        """Async variant of `DPDClient.iter_drug_product`; use with `async for`."""
+        return self._iter_models(
+            "drug_product",
+            validate=validate,
+            id=id,
+            din=din,
+            brandname=brandname,
+            status=status,
+            lang=lang,
+        )
+
+    def _iter_models(
+        self, name: str, *, validate: bool | None, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        spec = _ENDPOINTS[name]
+        params = spec.params(self.default_lang, kwargs)
+        if validate is None:
+            validate = not self.trust_responses
+        return self._stream_models(spec.model, self._urls[name], params, validate)
+
+    async def _stream_models(
+        self, model: Type[BaseModel], url: httpx.URL, params: Dict[str, Any], validate: bool
+    ) -> AsyncIterator[Any]:
+        parser = ItemParser()
+        async with self._http.stream(url, params) as chunks:
+            async for chunk in chunks:
+                for item in _row_models(model, _parse_chunk(parser, chunk), validate):
+                    yield item
+        for item in _row_models(model, _parse_chunk(parser, None), validate):
+            yield item
 
     # Backwards-compatible aliases (pre-0.2 method names).
     drugproduct = drug_product
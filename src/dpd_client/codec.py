@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+_orjson_module: ModuleType | None
+try:
+    import orjson as _orjson_module
+except ModuleNotFoundError:  # optional dependency: pip install dpd-client[fast]
+    _orjson_module = None
+
+orjson: ModuleType | None = _orjson_module
+
+
+def loads(content: bytes) -> Any:
+    """Decode a JSON document from raw bytes.
+
+    Uses `orjson` when installed and the standard library otherwise. Both
+    raise a `json.JSONDecodeError` subclass on malformed input.
+    """
+
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# ijson ships no type information, so it is imported by name to keep the
+# annotated fallback below consistent with the orjson one.
+_ijson_module: ModuleType | None
+try:
+    _ijson_module = import_module("ijson")
+except ModuleNotFoundError:  # optional dependency: pip install dpd-client[stream]
+    _ijson_module = None
+
+ijson: ModuleType | None = _ijson_module
+
+
+class ItemParser:
+    """Incrementally decode the items of a JSON list body.
+
+    Feed raw chunks as they arrive; each call returns the items completed so
+    far. With `ijson` installed, list bodies are parsed as they stream in so
+    only one chunk and the pending items are held at a time. Without it (or
+    for single-object and `null` bodies) the body is buffered and decoded by
+    `close`, which returns the same items the non-streaming path would.
+    Malformed input raises `json.JSONDecodeError`.
+    """
+
+    __slots__ = ("_buffer", "_items", "_coro", "_started")
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._items: list[Any] = []
+        self._coro: Any = None
+        self._started = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        if self._coro is not None:
+            return self._send(chunk)
+        self._buffer += chunk
+        if self._started or ijson is None:
+            return []
+        head = self._buffer.lstrip()
+        if not head:
+            return []
+        self._started = True
+        if head[:1] != b"[":
+            return []
+        self._items = ijson.sendable_list()
+        self._coro = ijson.items_coro(self._items, "item", use_float=True)
+        buffered, self._buffer = bytes(self._buffer), bytearray()
+        return self._send(buffered)
+
+    def close(self) -> list[Any]:
+        if self._coro is not None:
+            try:
+                self._coro.close()
+            except ijson.common.JSONError as exc:  # type: ignore[union-attr]
+                raise json.JSONDecodeError(str(exc), "", 0) from exc
+            return self._drain()
+        if not self._buffer.strip():
+            return []
+        data = loads(bytes(self._buffer))
+        if isinstance(data, list):
+            return data
+        return [] if data is None else [data]
+
+    def _send(self, chunk: bytes) -> list[Any]:
+        try:
+            self._coro.send(chunk)
+        except ijson.common.JSONError as exc:  # type: ignore[union-attr]
+            raise json.JSONDecodeError(str(exc), "", 0) from exc
+        return self._drain()
+
+    def _drain(self) -> list[Any]:
+        items, self._items[:] = list(self._items), []
+        return items
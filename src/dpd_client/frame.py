@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+from .errors import DPDDecodeError
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+def read_frame(content: bytes) -> pl.DataFrame:
+    """Load a raw JSON response body straight into a polars `DataFrame`.
+
+    Rows never become Python objects: polars parses the bytes into columnar
+    buffers itself. Single-object and empty (`null`) bodies are accepted the
+    same way the model-based methods accept them. Requires the optional
+    `frame` extra (`pip install dpd-client[frame]`).
+    """
+
+    try:
+        import polars as pl
+    except ModuleNotFoundError as exc:
+        raise ModuleNotFoundError(
+            "DataFrame output requires polars; install it with `pip install dpd-client[frame]`"
+        ) from exc
+
+    body = content.strip()
+    if not body or body == b"null":
+        return pl.DataFrame()
+    if body[:1] == b"{":
+        # Some endpoints return a single object instead of a list.
+        body = b"[" + body + b"]"
+    try:
+        return pl.read_json(io.BytesIO(body))
+    except pl.exceptions.PolarsError as exc:
+        raise DPDDecodeError("Failed to decode JSON response") from exc
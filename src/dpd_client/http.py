@@ -1,24 +1,154 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+import os
+import random
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from importlib.util import find_spec
+from time import perf_counter_ns
+from typing import Any, AsyncIterator, Iterator
+from urllib.parse import urlencode
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception
 
+from .codec import loads as _loads
 from .errors import DPDHTTPError, DPDDecodeError
+from .trace import Span, current_span
 
 
-Retryable = (httpx.ConnectError, httpx.ReadError, httpx.RemoteProtocolError, httpx.PoolTimeout)
+# Pool sized for concurrent fan-out; idle connections stay warm for 5 minutes.
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=300.0
+)
 
+Retryable = (
+    httpx.ConnectError,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+    httpx.TimeoutException,
+)
 
-def _is_retryable_exception(exc: BaseException) -> bool:
-    if isinstance(exc, Retryable):
-        return True
-    if isinstance(exc, httpx.HTTPStatusError):
-        status = exc.response.status_code
-        return status == 429 or 500 <= status < 600
-    return False
+# Retry delay with "full jitter": uniform in [0, min(cap, base * 2**(attempt - 1))],
+# so clients failing together do not retry in lockstep.
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 4.0
+
+# 429 Too Many Requests and every 5xx; one set lookup per response.
+RETRYABLE_STATUSES = frozenset({429, *range(500, 600)})
+
+
+def _is_retryable_response(resp: httpx.Response) -> bool:
+    return resp.status_code in RETRYABLE_STATUSES
+
+
+def _backoff(attempt: int) -> float:
+    """Seconds to wait after failed attempt number `attempt` (1-based)."""
+    return random.uniform(0.0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** (attempt - 1)))
+
+
+def _with_query(
+    url: str | httpx.URL, params: dict[str, Any] | None
+) -> tuple[str | httpx.URL, dict[str, Any] | None]:
+    """Fold `params` into `url`'s query string ahead of httpx.
+
+    Passing `params=` makes httpx build and merge a `QueryParams` object per
+    request; encoding the plain str/int values every DPD builder produces
+    straight into a resolved URL gives the same query bytes for about half
+    the cost. Other URLs or value types are left for httpx to encode.
+    """
+    if not params or not isinstance(url, httpx.URL) or url.query:
+        return url, params
+    for value in params.values():
+        if type(value) is not str and type(value) is not int:
+            return url, params
+    return url.copy_with(query=urlencode(params).encode("ascii")), None
+
+
+def _default_headers(user_agent: str | None, headers: dict[str, str] | None) -> dict[str, str]:
+    """Headers sent on every request; httpx merges them over its own defaults."""
+    default_headers = {"Accept": "application/json"}
+    if user_agent:
+        default_headers["User-Agent"] = user_agent
+    if headers:
+        default_headers.update(headers)
+    return default_headers
+
+
+def _status_error(resp: httpx.Response) -> DPDHTTPError:
+    req_url = str(resp.request.url) if getattr(resp, "request", None) else None
+    return DPDHTTPError(resp.status_code, resp.text, url=req_url)
+
+
+def _http2_available() -> bool:
+    """Whether HTTP/2 can be negotiated: `h2` is installed and `DPD_HTTP2` is not "0".
+
+    Set `DPD_HTTP2=0` to fall back to HTTP/1.1, e.g. behind proxies that
+    mishandle HTTP/2.
+    """
+    if os.environ.get("DPD_HTTP2", "").strip() == "0":
+        return False
+    return find_spec("h2") is not None
+
+
+@dataclass
+class JSONResponse:
+    """Decoded response body plus the validators needed to revalidate it.
+
+    `not_modified` is set when the server answered a conditional request
+    with `304 Not Modified`; `data` is None in that case. `content` holds the
+    raw body and `data` stays None when the body was fetched with
+    `decode=False`.
+    """
+
+    data: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+    content: bytes = b""
+
+
+def _conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str] | None:
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers or None
+
+
+def _raise_for_client_error(resp: httpx.Response) -> None:
+    if 400 <= resp.status_code < 500:
+        raise _status_error(resp)
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a response body, raising `DPDDecodeError` if it is not JSON."""
+    try:
+        return _loads(content)
+    except json.JSONDecodeError as exc:
+        raise DPDDecodeError("Failed to decode JSON response") from exc
+
+
+def _json_response(
+    resp: httpx.Response, span: Span | None = None, decode: bool = True
+) -> JSONResponse:
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if resp.status_code == 304:
+        return JSONResponse(None, etag, last_modified, not_modified=True)
+    _raise_for_client_error(resp)
+    content = resp.content
+    if span is not None:
+        span.bytes_in += len(content)
+    if not decode:
+        return JSONResponse(None, etag, last_modified, content=content)
+    start = perf_counter_ns() if span is not None else 0
+    data = decode_json(content)
+    if span is not None:
+        span.parse_ns += perf_counter_ns() - start
+    return JSONResponse(data, etag, last_modified, content=content)
 
 
 class HTTPClient:
@@ -32,65 +162,113 @@ class HTTPClient:
         max_retries: int = 3,
         user_agent: str | None = None,
         headers: dict[str, str] | None = None,
-        cache_ttl: float | int | None = None,
+        http2: bool | None = None,
+        limits: httpx.Limits | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/") + "/"
         self.timeout = timeout
         self.max_retries = max_retries
-        self._client = httpx.Client(base_url=self.base_url, timeout=timeout)
-        self._cache_ttl = float(cache_ttl) if cache_ttl else 0.0
-        self._cache: dict[str, tuple[float, Any]] = {}
-        default_headers = {"Accept": "application/json"}
-        if user_agent:
-            default_headers["User-Agent"] = user_agent
-        if headers:
-            default_headers.update(headers)
-        self._client.headers.update(default_headers)
+        self.http2 = _http2_available() if http2 is None else http2
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers=_default_headers(user_agent, headers),
+            http2=self.http2,
+            limits=limits or DEFAULT_POOL_LIMITS,
+        )
 
     def close(self) -> None:
         self._client.close()
 
-    def _request(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
-        @retry(
-            stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential_jitter(initial=0.5, max=4),
-            retry=retry_if_exception(_is_retryable_exception),
-            reraise=True,
-        )
-        def _do() -> httpx.Response:
-            resp = self._client.get(url, params=params)
-            if resp.status_code == 429 or 500 <= resp.status_code < 600:
-                # surface as HTTPStatusError to trigger retry predicate
-                try:
-                    resp.raise_for_status()
-                except httpx.HTTPStatusError as exc:  # pragma: no cover - re-raised by tenacity
-                    raise exc
-            return resp
+    def resolve(self, path: str) -> httpx.URL:
+        """Return `path` joined to the base URL, ready to pass to the request methods.
+
+        Absolute `httpx.URL`s skip httpx's per-request parse and merge with the
+        base URL, so callers should resolve fixed paths once and reuse them.
+        """
+        return httpx.URL(self.base_url + path)
+
+    def _request(
+        self,
+        url: str | httpx.URL,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        # Retry on the status code directly: no exception is built per failed
+        # attempt, and DPDHTTPError is only created once retries run out.
+        # With `stream=True` the body of the returned response is left unread.
+        url, params = _with_query(url, params)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                request = self._client.build_request("GET", url, params=params, headers=headers)
+                resp = self._client.send(request, stream=stream)
+            except Retryable as exc:
+                if attempt >= self.max_retries:
+                    raise DPDHTTPError(-1, str(exc)) from exc
+            except httpx.HTTPError as exc:
+                raise DPDHTTPError(-1, str(exc)) from exc
+            else:
+                if not _is_retryable_response(resp):
+                    return resp
+                if stream:
+                    resp.read()
+                    resp.close()
+                if attempt >= self.max_retries:
+                    raise _status_error(resp)
+            time.sleep(_backoff(attempt))
 
+    @contextmanager
+    def stream(
+        self, url: str | httpx.URL, params: dict[str, Any] | None = None
+    ) -> Iterator[Iterator[bytes]]:
+        """GET `url` and yield an iterator over the body's chunks as they arrive.
+
+        Failed attempts are retried like other requests until the response
+        starts; errors while the body is downloading are not retried.
+        """
+        resp = self._request(url, params=params, stream=True)
         try:
-            return _do()
-        except httpx.HTTPStatusError as exc:
-            raise DPDHTTPError(exc.response.status_code, exc.response.text, url=str(exc.request.url)) from exc
-        except httpx.HTTPError as exc:
-            raise DPDHTTPError(-1, str(exc)) from exc
-
-    def get_json(self, url: str, params: dict[str, Any] | None = None) -> Any:
-        key = _cache_key(url, params)
-        if self._cache_ttl:
-            hit = self._cache.get(key)
-            if hit and hit[0] >= _now():
-                return hit[1]
+            if 400 <= resp.status_code < 500:
+                resp.read()
+                raise _status_error(resp)
+            yield _iter_chunks(resp)
+        finally:
+            resp.close()
+
+    def get_json(self, url: str | httpx.URL, params: dict[str, Any] | None = None) -> Any:
+        return self.fetch_json(url, params).data
+
+    def get_bytes(self, url: str | httpx.URL, params: dict[str, Any] | None = None) -> bytes:
+        """GET `url` and return the undecoded response body."""
         resp = self._request(url, params=params)
-        if 400 <= resp.status_code < 500:
-            req_url = str(resp.request.url) if getattr(resp, "request", None) else None
-            raise DPDHTTPError(resp.status_code, resp.text, url=req_url)
-        try:
-            data = resp.json()
-            if self._cache_ttl:
-                self._cache[key] = (_now() + self._cache_ttl, data)
-            return data
-        except json.JSONDecodeError as exc:  # pragma: no cover
-            raise DPDDecodeError("Failed to decode JSON response") from exc
+        _raise_for_client_error(resp)
+        return resp.content
+
+    def fetch_json(
+        self,
+        url: str | httpx.URL,
+        params: dict[str, Any] | None = None,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        decode: bool = True,
+    ) -> JSONResponse:
+        """GET `url` and decode it, revalidating against `etag`/`last_modified` if given.
+
+        With `decode=False` the body is left undecoded in `content`.
+        """
+        headers = _conditional_headers(etag, last_modified)
+        span = current_span()
+        if span is None:
+            resp = self._request(url, params=params, headers=headers)
+            return _json_response(resp, decode=decode)
+        start = perf_counter_ns()
+        resp = self._request(url, params=params, headers=headers)
+        span.http_ns += perf_counter_ns() - start
+        return _json_response(resp, span, decode)
 
 
 class AsyncHTTPClient:
@@ -104,86 +282,138 @@ class AsyncHTTPClient:
         max_retries: int = 3,
         user_agent: str | None = None,
         headers: dict[str, str] | None = None,
-        cache_ttl: float | int | None = None,
+        http2: bool | None = None,
+        limits: httpx.Limits | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/") + "/"
         self.timeout = timeout
         self.max_retries = max_retries
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=timeout)
-        self._cache_ttl = float(cache_ttl) if cache_ttl else 0.0
-        self._cache: dict[str, tuple[float, Any]] = {}
-        default_headers = {"Accept": "application/json"}
-        if user_agent:
-            default_headers["User-Agent"] = user_agent
-        if headers:
-            default_headers.update(headers)
-        self._client.headers.update(default_headers)
+        self.http2 = _http2_available() if http2 is None else http2
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers=_default_headers(user_agent, headers),
+            http2=self.http2,
+            limits=limits or DEFAULT_POOL_LIMITS,
+        )
+        self._in_flight = 0
+        self._requests = 0
 
     async def aclose(self) -> None:
         await self._client.aclose()
 
-    async def _request(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
-        # Manual retry loop for async to avoid tenacity's async overhead.
-        attempts = 0
-        last_exc: BaseException | None = None
-        while attempts < self.max_retries:
+    def resolve(self, path: str) -> httpx.URL:
+        """See `HTTPClient.resolve`."""
+        return httpx.URL(self.base_url + path)
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of request activity on this client.
+
+        `in_flight` counts requests currently awaiting a response; with HTTP/2
+        these are multiplexed as streams over shared connections.
+        """
+        return {"http2": self.http2, "in_flight": self._in_flight, "requests": self._requests}
+
+    async def _request(
+        self,
+        url: str | httpx.URL,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        # Same retry loop as `HTTPClient._request`, sleeping without blocking the loop.
+        # With `stream=True` the body of the returned response is left unread.
+        url, params = _with_query(url, params)
+        attempt = 0
+        while True:
+            attempt += 1
+            self._in_flight += 1
+            self._requests += 1
             try:
-                resp = await self._client.get(url, params=params)
-                if resp.status_code == 429 or 500 <= resp.status_code < 600:
-                    resp.raise_for_status()
-                return resp
-            except (
-                httpx.ConnectError,
-                httpx.ReadError,
-                httpx.RemoteProtocolError,
-                httpx.PoolTimeout,
-                httpx.HTTPStatusError,
-            ) as exc:
-                last_exc = exc
-                attempts += 1
-                # exponential backoff with jitter
-                sleep_for = min(4.0, (2 ** (attempts - 1)) + (0.1 * attempts))
-                await _async_sleep(sleep_for)
-        # exhausted retries
-        assert last_exc is not None
-        if isinstance(last_exc, httpx.HTTPStatusError):
-            raise DPDHTTPError(last_exc.response.status_code, last_exc.response.text, url=str(last_exc.request.url)) from last_exc
-        raise DPDHTTPError(-1, str(last_exc)) from last_exc
-
-    async def get_json(self, url: str, params: dict[str, Any] | None = None) -> Any:
-        key = _cache_key(url, params)
-        if self._cache_ttl:
-            hit = self._cache.get(key)
-            if hit and hit[0] >= _now():
-                return hit[1]
-        resp = await self._request(url, params=params)
-        if 400 <= resp.status_code < 500:
-            req_url = str(resp.request.url) if getattr(resp, "request", None) else None
-            raise DPDHTTPError(resp.status_code, resp.text, url=req_url)
+                if stream:
+                    request = self._client.build_request("GET", url, params=params, headers=headers)
+                    resp = await self._client.send(request, stream=True)
+                else:
+                    resp = await self._client.get(url, params=params, headers=headers)
+            except Retryable as exc:
+                if attempt >= self.max_retries:
+                    raise DPDHTTPError(-1, str(exc)) from exc
+            except httpx.HTTPError as exc:
+                raise DPDHTTPError(-1, str(exc)) from exc
+            else:
+                if not _is_retryable_response(resp):
+                    return resp
+                if stream:
+                    await resp.aread()
+                    await resp.aclose()
+                if attempt >= self.max_retries:
+                    raise _status_error(resp)
+            finally:
+                self._in_flight -= 1
+            await _async_sleep(_backoff(attempt))
+
+    @asynccontextmanager
+    async def stream(
+        self, url: str | httpx.URL, params: dict[str, Any] | None = None
+    ) -> AsyncIterator[AsyncIterator[bytes]]:
+        """Async variant of `HTTPClient.stream`."""
+        resp = await self._request(url, params=params, stream=True)
         try:
-            data = resp.json()
-            if self._cache_ttl:
-                self._cache[key] = (_now() + self._cache_ttl, data)
-            return data
-        except json.JSONDecodeError as exc:  # pragma: no cover
-            raise DPDDecodeError("Failed to decode JSON response") from exc
+            if 400 <= resp.status_code < 500:
+                await resp.aread()
+                raise _status_error(resp)
+            yield _aiter_chunks(resp)
+        finally:
+            await resp.aclose()
 
+    async def get_json(self, url: str | httpx.URL, params: dict[str, Any] | None = None) -> Any:
+        return (await self.fetch_json(url, params)).data
 
-async def _async_sleep(seconds: float) -> None:
-    # simple local sleep to avoid bringing in asyncio in the module API
-    import asyncio
+    async def get_bytes(self, url: str | httpx.URL, params: dict[str, Any] | None = None) -> bytes:
+        """Async variant of `HTTPClient.get_bytes`."""
+        resp = await self._request(url, params=params)
+        _raise_for_client_error(resp)
+        return resp.content
+
+    async def fetch_json(
+        self,
+        url: str | httpx.URL,
+        params: dict[str, Any] | None = None,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        decode: bool = True,
+    ) -> JSONResponse:
+        """Async variant of `HTTPClient.fetch_json`."""
+        headers = _conditional_headers(etag, last_modified)
+        span = current_span()
+        if span is None:
+            resp = await self._request(url, params=params, headers=headers)
+            return _json_response(resp, decode=decode)
+        start = perf_counter_ns()
+        resp = await self._request(url, params=params, headers=headers)
+        span.http_ns += perf_counter_ns() - start
+        return _json_response(resp, span, decode)
+
+
+def _iter_chunks(resp: httpx.Response) -> Iterator[bytes]:
+    try:
+        yield from resp.iter_bytes()
+    except httpx.HTTPError as exc:
+        raise DPDHTTPError(-1, str(exc)) from exc
 
-    await asyncio.sleep(seconds)
 
+async def _aiter_chunks(resp: httpx.Response) -> AsyncIterator[bytes]:
+    try:
+        async for chunk in resp.aiter_bytes():
+            yield chunk
+    except httpx.HTTPError as exc:
+        raise DPDHTTPError(-1, str(exc)) from exc
 
-def _cache_key(url: str, params: dict[str, Any] | None) -> str:
-    if not params:
-        return url
-    parts = [f"{k}={params[k]}" for k in sorted(params.keys())]
-    return f"{url}?{'&'.join(parts)}"
 
+async def _async_sleep(seconds: float) -> None:
+    # simple local sleep to avoid bringing in asyncio in the module API
+    import asyncio
 
-def _now() -> float:
-    import time
+    await asyncio.sleep(seconds)
 
-    return time.time()
@@ -18,9 +18,7 @@ def base_params(default_lang: str, lang: str | None) -> Dict[str, Any]:
 def params_with_id_lang(default_lang: str, *, id: int, lang: str | None) -> Dict[str, Any]:
     """Base params with `id` and resolved `lang`."""
 
-    params = base_params(default_lang, lang)
-    params["id"] = id
-    return params
+    return {"type": "json", "lang": lang or default_lang, "id": id}
 
 
 def params_with_id_lang_active(
@@ -28,10 +26,9 @@ def params_with_id_lang_active(
 ) -> Dict[str, Any]:
     """Base params with `id`, resolved `lang`, and optional `active=yes`."""
 
-    params = params_with_id_lang(default_lang, id=id, lang=lang)
     if active:
-        params["active"] = "yes"
-    return params
+        return {"type": "json", "lang": lang or default_lang, "id": id, "active": "yes"}
+    return {"type": "json", "lang": lang or default_lang, "id": id}
 
 
 def params_packaging(id: int) -> Dict[str, Any]:
@@ -60,7 +57,7 @@ def params_drugproduct(
     Requires at least one of: id, din, brandname, status.
     """
 
-    if not any([id, din, brandname, status]):
+    if id is None and din is None and brandname is None and status is None:
         raise DPDInvalidParam("Provide at least one of id, din, brandname, or status")
     params = base_params(default_lang, lang)
     if id is not None:
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Type, Union
+
+from pydantic import BaseModel
+
+from .errors import DPDDecodeError
+
+_STRUCTS: Dict[Type[BaseModel], Any] = {}
+_DECODERS: Dict[Type[BaseModel], Any] = {}
+
+
+def _msgspec() -> Any:
+    try:
+        import msgspec
+    except ModuleNotFoundError as exc:
+        raise ModuleNotFoundError(
+            "Struct output requires msgspec; install it with `pip install dpd-client[structs]`"
+        ) from exc
+    return msgspec
+
+
+def struct_type(model: Type[BaseModel]) -> Any:
+    """Return the `msgspec.Struct` class mirroring pydantic `model`.
+
+    The struct is derived from the model's fields (names, types and defaults)
+    the first time it is requested, so the two never drift apart. Structs
+    are keyword-only and ignore fields the model does not declare. Requires
+    the optional `structs` extra.
+    """
+    struct = _STRUCTS.get(model)
+    if struct is None:
+        msgspec = _msgspec()
+        required = []
+        optional = []
+        for name, field in model.model_fields.items():
+            if field.is_required():
+                required.append((name, field.annotation))
+            else:
+                optional.append((name, field.annotation, field.default))
+        struct = _STRUCTS[model] = msgspec.defstruct(
+            f"{model.__name__}Struct", required + optional, kw_only=True
+        )
+    return struct
+
+
+def decode_structs(model: Type[BaseModel], content: bytes) -> List[Any]:
+    """Decode a raw JSON response body straight into structs for `model`.
+
+    msgspec parses and type-checks the bytes in one pass without building
+    dicts or pydantic models. Lists, single objects and `null` bodies are
+    accepted like the model-based methods; strings are coerced to numbers the
+    way pydantic's lax mode does. Malformed or mismatched bodies raise
+    `DPDDecodeError`.
+    """
+    msgspec = _msgspec()
+    decoder = _DECODERS.get(model)
+    if decoder is None:
+        struct = struct_type(model)
+        target = Union[List[struct], struct, None]  # type: ignore[valid-type]
+        decoder = _DECODERS[model] = msgspec.json.Decoder(target, strict=False)
+    try:
+        data = decoder.decode(content)
+    except msgspec.DecodeError as exc:  # ValidationError is a subclass
+        raise DPDDecodeError("Failed to decode JSON response") from exc
+    if isinstance(data, list):
+        return data
+    return [] if data is None else [data]
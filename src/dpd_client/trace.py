@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any, Deque, Dict, Iterator
+
+
+@dataclass
+class Span:
+    """Time spent in each phase of one resource call, in nanoseconds.
+
+    `http_ns` covers sending the request until the body is read, `parse_ns`
+    separate JSON decoding and `validate_ns` building models. Resource calls
+    validate straight from the raw body, so their decoding is counted in
+    `validate_ns`. Cache hits leave all three at zero.
+    """
+
+    http_ns: int = 0
+    parse_ns: int = 0
+    validate_ns: int = 0
+    bytes_in: int = 0
+
+
+_SPAN: ContextVar[Span | None] = ContextVar("dpd_client_span", default=None)
+
+
+def current_span() -> Span | None:
+    """Return the span of the resource call running in this context, if traced."""
+    return _SPAN.get()
+
+
+def _trace_enabled() -> bool:
+    """Whether clients record call timings; set `DPD_TRACE=0` to turn tracing off."""
+    return os.environ.get("DPD_TRACE", "").strip() != "0"
+
+
+class Tracer:
+    """Per-endpoint ring buffers of call timings.
+
+    The span for the active call lives in a context variable, so concurrent
+    tasks on one client are attributed separately and the HTTP layer can
+    record into it without extra arguments. Only the latest `maxlen` calls
+    per endpoint are kept for percentiles.
+    """
+
+    def __init__(self, maxlen: int = 1024) -> None:
+        self.maxlen = maxlen
+        self._samples: Dict[str, Deque[tuple[int, Span]]] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        """Time the block as one call to `name`; failed calls are not recorded."""
+        span = Span()
+        token = _SPAN.set(span)
+        start = perf_counter_ns()
+        try:
+            yield span
+        finally:
+            _SPAN.reset(token)
+        elapsed = perf_counter_ns() - start
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.maxlen)
+            samples.append((elapsed, span))
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            snapshot = {name: list(samples) for name, samples in self._samples.items()}
+            counts = dict(self._counts)
+        return {
+            name: {
+                "count": counts[name],
+                "p50_ns": _percentile([total for total, _ in samples], 0.50),
+                "p99_ns": _percentile([total for total, _ in samples], 0.99),
+                "http_p50_ns": _percentile([s.http_ns for _, s in samples], 0.50),
+                "parse_p50_ns": _percentile([s.parse_ns for _, s in samples], 0.50),
+                "validate_p50_ns": _percentile([s.validate_ns for _, s in samples], 0.50),
+                "bytes_in": sum(s.bytes_in for _, s in samples),
+            }
+            for name, samples in snapshot.items()
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+
+def _percentile(values: list[int], q: float) -> int:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
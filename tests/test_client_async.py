@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator
 
 import httpx
@@ -5,7 +6,7 @@ import pytest
 import pytest_asyncio
 import respx
 
-from dpd_client import AsyncDPDClient
+from dpd_client import AsyncDPDClient, DPDHTTPError, DPDInvalidParam
 from dpd_client.client import BASE_URL
 
 
@@ -179,3 +180,282 @@ async def test_async_endpoints_map_active_true_to_yes(
     request = route.calls.last.request
     params = dict(request.url.params)
     assert params.get("active") == "yes"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_drug_product_many_preserves_input_order(
+    async_client: AsyncDPDClient,
+) -> None:
+    def _respond(request: httpx.Request) -> httpx.Response:
+        din = request.url.params["din"]
+        body = [{"drug_code": int(din), "drug_identification_number": din}]
+        return httpx.Response(200, json=body)
+
+    route = respx.get(f"{BASE_URL}drugproduct/").mock(side_effect=_respond)
+
+    items = await async_client.drug_product_many(dins=["3", "1", "2"], max_concurrency=2)
+
+    assert route.call_count == 3
+    assert [item.drug_code for item in items] == [3, 1, 2]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_company_many_reraises_failures(async_client: AsyncDPDClient) -> None:
+    respx.get(f"{BASE_URL}company/", params={"id": "1"}).mock(
+        return_value=httpx.Response(200, json=[{"company_code": 1, "company_name": "ACME"}])
+    )
+    respx.get(f"{BASE_URL}company/", params={"id": "2"}).mock(
+        return_value=httpx.Response(404, text="missing")
+    )
+
+    with pytest.raises(DPDHTTPError):
+        await async_client.company_many(ids=[1, 2])
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_caching_prevents_second_request() -> None:
+    route = respx.get(f"{BASE_URL}company/").mock(
+        return_value=httpx.Response(200, json={"company_code": 5, "company_name": "ACME"})
+    )
+
+    client = AsyncDPDClient(cache_ttl=60)
+    try:
+        first = await client.company(id=5)
+        second = await client.company(id=5)
+    finally:
+        await client.aclose()
+
+    assert first == second
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_stream_drug_product_yields_every_din(async_client: AsyncDPDClient) -> None:
+    def _respond(request: httpx.Request) -> httpx.Response:
+        din = request.url.params["din"]
+        return httpx.Response(200, json={"drug_code": int(din), "drug_identification_number": din})
+
+    respx.get(f"{BASE_URL}drugproduct/").mock(side_effect=_respond)
+
+    async def _dins() -> AsyncGenerator[str, None]:
+        for i in range(10):
+            yield str(i)
+
+    stream = async_client.stream_drug_product(_dins(), workers=3)
+    results = {din: items async for din, items in stream}
+
+    assert sorted(results, key=int) == [str(i) for i in range(10)]
+    assert results["7"][0].drug_code == 7
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_stream_drug_product_raises_first_failure(
+    async_client: AsyncDPDClient,
+) -> None:
+    respx.get(f"{BASE_URL}drugproduct/").mock(return_value=httpx.Response(404, text="missing"))
+
+    with pytest.raises(DPDHTTPError):
+        async for _ in async_client.stream_drug_product(["1", "2", "3"], workers=2):
+            pass
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_stats_count_requests(async_client: AsyncDPDClient) -> None:
+    respx.get(f"{BASE_URL}status/").mock(return_value=httpx.Response(200, json=[]))
+
+    await async_client.status(id=1)
+    await async_client.status(id=2)
+
+    stats = async_client.stats()
+    assert stats["requests"] == 2
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_active_ingredient_df_reads_raw_json(async_client: AsyncDPDClient) -> None:
+    pytest.importorskip("polars")
+    respx.get(f"{BASE_URL}activeingredient/").mock(
+        return_value=httpx.Response(200, json=[{"drug_code": 22, "ingredient_name": "X"}])
+    )
+
+    frame = await async_client.active_ingredient_df(id=22)
+
+    assert frame.to_dicts() == [{"drug_code": 22, "ingredient_name": "X"}]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_iter_drug_product_yields_models_across_chunks(
+    async_client: AsyncDPDClient,
+) -> None:
+    async def body() -> AsyncGenerator[bytes, None]:
+        for chunk in (b'[{"drug_code": 1}, {"drug_', b'code": 2, "brand_name": "B"}]'):
+            yield chunk
+
+    respx.get(f"{BASE_URL}drugproduct/").mock(return_value=httpx.Response(200, content=body()))
+
+    products = [p async for p in async_client.iter_drug_product(brandname="b")]
+
+    assert [(p.drug_code, p.brand_name) for p in products] == [(1, None), (2, "B")]
+    assert async_client.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_active_ingredient_raw_returns_dicts(async_client: AsyncDPDClient) -> None:
+    respx.get(f"{BASE_URL}activeingredient/").mock(
+        return_value=httpx.Response(200, content=b"null")
+    )
+
+    assert await async_client.active_ingredient_raw(id=22) == []
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_metrics_record_each_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DPD_TRACE", raising=False)
+    respx.get(f"{BASE_URL}company/").mock(
+        return_value=httpx.Response(200, json=[{"company_code": 1, "company_name": "ACME"}])
+    )
+    client = AsyncDPDClient()
+    try:
+        await client.company_many(ids=[1, 2, 3])
+        metrics = client.metrics()["company"]
+    finally:
+        await client.aclose()
+
+    assert metrics["count"] == 3
+    assert metrics["bytes_in"] > 0
+    assert 0 < metrics["http_p50_ns"] <= metrics["p50_ns"] <= metrics["p99_ns"]
+
+
+@pytest.mark.asyncio
+async def test_async_metrics_disabled_by_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DPD_TRACE", "0")
+    client = AsyncDPDClient()
+    try:
+        assert client.metrics() == {}
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_drug_product_first_returns_first_match(async_client: AsyncDPDClient) -> None:
+    def respond(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("brandname") == "SINEQUAN":
+            return httpx.Response(200, json=[{"drug_code": 2049, "brand_name": "SINEQUAN"}])
+        if request.url.params.get("din") == "bad":
+            return httpx.Response(404, text="missing")
+        return httpx.Response(200, json=[])
+
+    respx.get(f"{BASE_URL}drugproduct/").mock(side_effect=respond)
+
+    found = await async_client.drug_product_first(dins=["00000000", "bad"], brandnames=["SINEQUAN"])
+    missing = await async_client.drug_product_first(dins=["00000000"])
+
+    assert [p.drug_code for p in found] == [2049]
+    assert missing == []
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_bundle_fetches_sections_by_drug_code(async_client: AsyncDPDClient) -> None:
+    form = respx.get(f"{BASE_URL}form/").mock(
+        return_value=httpx.Response(200, json=[{"drug_code": 7, "pharmaceutical_form_name": "TAB"}])
+    )
+    packaging = respx.get(f"{BASE_URL}packaging/").mock(
+        return_value=httpx.Response(200, json=[{"drug_code": 7, "package_size": "100"}])
+    )
+
+    bundle = await async_client.bundle(7, sections=["form", "packaging"], lang="fr")
+
+    assert list(bundle) == ["form", "packaging"]
+    assert bundle["form"][0].pharmaceutical_form_name == "TAB"
+    assert bundle["packaging"][0].package_size == "100"
+    assert form.calls[0].request.url.params["lang"] == "fr"
+    assert "lang" not in packaging.calls[0].request.url.params
+    with pytest.raises(DPDInvalidParam):
+        await async_client.bundle(7, sections=["company"])
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_identical_concurrent_calls_share_one_request(
+    async_client: AsyncDPDClient,
+) -> None:
+    route = respx.get(f"{BASE_URL}company/").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"company_code": 5, "company_name": "ACME"}]),
+            httpx.Response(404, text="missing"),
+        ]
+    )
+
+    first, second = await asyncio.gather(async_client.company(id=5), async_client.company(id=5))
+    failures = await asyncio.gather(
+        async_client.company(id=5), async_client.company(id=5), return_exceptions=True
+    )
+
+    assert first == second and first[0].company_name == "ACME"
+    assert first is not second
+    assert all(isinstance(exc, DPDHTTPError) for exc in failures)
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_call_after_cancelled_flight_fetches_afresh(
+    async_client: AsyncDPDClient,
+) -> None:
+    hold = asyncio.Event()
+    calls = 0
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await hold.wait()  # the first request never completes
+        return httpx.Response(200, json=[{"company_code": 5, "company_name": "ACME"}])
+
+    respx.get(f"{BASE_URL}company/").mock(side_effect=respond)
+
+    first = asyncio.ensure_future(async_client.company(id=5))
+    while not calls:
+        await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    second = await async_client.company(id=5)
+
+    assert first.cancelled()
+    assert second[0].company_name == "ACME"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_retries_5xx_then_raises_final_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    delays: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    monkeypatch.setattr("dpd_client.http._async_sleep", fake_sleep)
+    route = respx.get(f"{BASE_URL}status/").mock(return_value=httpx.Response(503, text="busy"))
+    client = AsyncDPDClient(retries=3)
+    try:
+        with pytest.raises(DPDHTTPError) as excinfo:
+            await client.status(id=1)
+    finally:
+        await client.aclose()
+
+    assert excinfo.value.status_code == 503
+    assert route.call_count == 3
+    assert len(delays) == 2
+    assert 0.0 <= delays[0] <= 0.5 and 0.0 <= delays[1] <= 1.0
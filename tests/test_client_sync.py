@@ -1,4 +1,5 @@
 from collections.abc import Generator
+from typing import Any, cast
 
 import httpx
 import pytest
@@ -165,6 +166,17 @@ def test_active_ingredient_requires_filter(client: DPDClient) -> None:
         client.active_ingredient()
 
 
+@respx.mock
+def test_falsy_filters_count_as_provided(client: DPDClient) -> None:
+    route = respx.get(f"{BASE_URL}drugproduct/").mock(return_value=httpx.Response(200, json=[]))
+    respx.get(f"{BASE_URL}activeingredient/").mock(return_value=httpx.Response(200, json=[]))
+
+    assert client.drug_product(id=0) == []
+    assert client.drug_product(din="") == []
+    assert client.active_ingredient(id=0) == []
+    assert route.calls[0].request.url.params["id"] == "0"
+
+
 @pytest.mark.parametrize(
     "method_name, endpoint",
     [
@@ -211,6 +223,236 @@ def test_sync_caching_prevents_second_request() -> None:
     assert route.call_count == 1
 
 
+@respx.mock
+def test_sync_cache_shares_entries_across_brandname_case() -> None:
+    route = respx.get(f"{BASE_URL}drugproduct/").mock(
+        return_value=httpx.Response(200, json=[{"drug_code": 1, "brand_name": "ASPIRIN"}])
+    )
+
+    client = DPDClient(cache_ttl=60)
+    try:
+        client.drug_product(brandname="ASPIRIN")
+        client.drug_product(brandname="aspirin")
+        client.drug_product(brandname="aspirin ")
+        client.drug_product(din="ASPIRIN")
+    finally:
+        client.close()
+
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_sync_cache_evicts_least_recently_used_entry() -> None:
+    route = respx.get(f"{BASE_URL}company/").mock(
+        return_value=httpx.Response(200, json=[{"company_code": 1, "company_name": "ACME"}])
+    )
+
+    client = DPDClient(cache_ttl=60, cache_maxsize=2)
+    try:
+        client.company(id=1)
+        client.company(id=2)
+        client.company(id=1)  # hit: id=1 becomes most recently used
+        client.company(id=3)  # evicts id=2
+        client.company(id=1)
+        client.company(id=2)
+    finally:
+        client.close()
+
+    assert route.call_count == 4
+
+
+@respx.mock
+def test_sync_expired_cache_entry_revalidates_with_etag(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr("dpd_client.cache._now", lambda: clock[0])
+    route = respx.get(f"{BASE_URL}company/").mock(
+        side_effect=[
+            httpx.Response(
+                200, json={"company_code": 5, "company_name": "ACME"}, headers={"ETag": '"v1"'}
+            ),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+        ]
+    )
+
+    client = DPDClient(cache_ttl=60)
+    try:
+        first = client.company(id=5)
+        clock[0] += 120
+        second = client.company(id=5)
+        third = client.company(id=5)
+    finally:
+        client.close()
+
+    assert route.call_count == 2
+    assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+    assert first == second == third
+
+
+@respx.mock
+def test_sync_cache_clear_forces_refetch() -> None:
+    route = respx.get(f"{BASE_URL}company/").mock(
+        return_value=httpx.Response(200, json={"company_code": 5, "company_name": "ACME"})
+    )
+
+    client = DPDClient(cache_ttl=60)
+    try:
+        client.company(id=5)
+        client.cache_clear()
+        client.company(id=5)
+    finally:
+        client.close()
+
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_sync_large_payload_validated_and_constructed_alike(client: DPDClient) -> None:
+    payload = [
+        {"drug_code": i, "ingredient_name": f"ING-{i}", "strength": "10", "extra_field": i}
+        for i in range(1000)
+    ]
+    respx.get(f"{BASE_URL}activeingredient/").mock(return_value=httpx.Response(200, json=payload))
+
+    validated = client.active_ingredient(ingredientname="ing")
+    constructed = client.active_ingredient(ingredientname="ing", validate=False)
+
+    assert len(validated) == len(constructed) == 1000
+    assert [item.model_dump() for item in validated] == [item.model_dump() for item in constructed]
+    assert validated[999].model_extra == {"extra_field": 999}
+
+
+@respx.mock
+def test_sync_drug_product_df_reads_raw_json(client: DPDClient) -> None:
+    pytest.importorskip("polars")
+    route = respx.get(f"{BASE_URL}drugproduct/").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"drug_code": 1, "brand_name": "A"}, {"drug_code": 2}]),
+            httpx.Response(200, json={"drug_code": 3, "brand_name": "C"}),
+        ]
+    )
+
+    frame = client.drug_product_df(brandname="a")
+    single = client.drug_product_df(din="00000003")
+
+    assert frame.columns == ["drug_code", "brand_name"]
+    assert frame["drug_code"].to_list() == [1, 2]
+    assert frame["brand_name"].to_list() == ["A", None]
+    assert single.to_dicts() == [{"drug_code": 3, "brand_name": "C"}]
+    assert route.calls[0].request.url.params["brandname"] == "a"
+
+
+@respx.mock
+def test_sync_raw_methods_return_unvalidated_dicts(client: DPDClient) -> None:
+    respx.get(f"{BASE_URL}drugproduct/").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"drug_code": "not-an-int", "extra": True}]),
+            httpx.Response(200, json={"drug_code": 3}),
+        ]
+    )
+
+    assert client.drug_product_raw(status="1") == [{"drug_code": "not-an-int", "extra": True}]
+    assert client.drug_product_raw(din="00000003") == [{"drug_code": 3}]
+
+
+@respx.mock
+def test_sync_drug_product_structs_decode_with_msgspec(client: DPDClient) -> None:
+    pytest.importorskip("msgspec")
+    from dpd_client.models import DrugProduct
+    from dpd_client.structs import struct_type
+
+    respx.get(f"{BASE_URL}drugproduct/").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"drug_code": "7", "brand_name": "A", "extra": 1}]),
+            httpx.Response(200, json={"drug_code": 8}),
+            httpx.Response(200, json=[{"brand_name": "missing code"}]),
+        ]
+    )
+
+    products = client.drug_product_structs(status="1")
+    single = client.drug_product_structs(din="00000008")
+
+    assert isinstance(products[0], struct_type(DrugProduct))
+    assert (products[0].drug_code, products[0].brand_name) == (7, "A")
+    assert single[0].drug_code == 8 and single[0].brand_name is None
+    with pytest.raises(DPDDecodeError):
+        client.drug_product_structs(status="2")
+
+
+@respx.mock
+def test_sync_irregular_bodies_fall_back_to_normalized_rows(client: DPDClient) -> None:
+    respx.get(f"{BASE_URL}company/").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"company_code": 1, "company_name": "ACME"}, "junk", None]),
+            httpx.Response(200, content=b"null"),
+            httpx.Response(200, json=[{"company_code": 3, "company_name": "ACME"}, "junk", None]),
+        ]
+    )
+
+    assert [c.company_name for c in client.company(id=1)] == ["ACME"]
+    assert client.company(id=2) == []
+    assert [c.company_code for c in client.company(id=3, validate=False)] == [3]
+
+
+@respx.mock
+@pytest.mark.parametrize("incremental", [True, False])
+def test_sync_iter_drug_product_yields_models_across_chunks(
+    client: DPDClient, monkeypatch: pytest.MonkeyPatch, incremental: bool
+) -> None:
+    if incremental:
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr("dpd_client.codec.ijson", None)
+    chunks = [b' [{"drug_code": 1, "brand_', b'name": "A"}, "junk", {"drug_', b'code": 2}]']
+    respx.get(f"{BASE_URL}drugproduct/").mock(
+        side_effect=[httpx.Response(200, content=iter(chunks)), httpx.Response(404)]
+    )
+
+    products = client.iter_drug_product(status="1")
+
+    assert [(p.drug_code, p.brand_name) for p in products] == [(1, "A"), (2, None)]
+    with pytest.raises(DPDHTTPError):
+        list(client.iter_drug_product(status="2"))
+    with pytest.raises(DPDInvalidParam):
+        client.iter_drug_product()
+
+
+def test_sync_transport_options_reach_httpx(monkeypatch: pytest.MonkeyPatch) -> None:
+    received: dict[str, Any] = {}
+    real_client = httpx.Client
+
+    def recording_client(**kwargs: Any) -> httpx.Client:
+        received.update(kwargs)
+        return real_client(**kwargs)
+
+    monkeypatch.setattr("dpd_client.http.httpx.Client", recording_client)
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=60.0)
+    client = DPDClient(http2=False, pool_limits=limits)
+    client.close()
+
+    assert received["http2"] is False
+    assert received["limits"] == limits
+
+
+@respx.mock
+def test_sync_trust_responses_skips_validation_but_not_explicit_validate() -> None:
+    route = respx.get(f"{BASE_URL}status/").mock(
+        return_value=httpx.Response(200, json=[{"drug_code": "7", "status": "MARKETED"}])
+    )
+    client = DPDClient(trust_responses=True, cache_ttl=60)
+    try:
+        trusted = client.status(id=7)
+        cached = client.status(id=7)
+        validated = client.status(id=7, validate=True)
+    finally:
+        client.close()
+
+    assert cast(Any, trusted[0]).drug_code == "7"
+    assert cached[0] is trusted[0]
+    assert validated[0].drug_code == 7
+    assert route.call_count == 2
+    assert DPDClient.construct(type(validated[0]), validated[0].model_dump()) == validated[0]
+
+
 @respx.mock
 def test_sync_404_raises_http_error() -> None:
     respx.get(f"{BASE_URL}drugproduct/").mock(return_value=httpx.Response(404, text="missing"))